@@ -4,7 +4,7 @@ import psutil
 from pathlib import Path
 from PIL import Image, ImageDraw
 from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QPixmapCache
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction
 
 from constants import Constants
@@ -12,7 +12,7 @@ from core.bing_wallpaper_service import WallpaperManager
 from ui import WallpaperNavigatorWindow
 from sys_platform.windows.startup import StartupManager
 from utils.logger import log_info, log_error
-from utils.file_utils import file_exists, write_json, delete_file
+from utils.file_utils import file_exists, write_json, delete_file, clear_file_exists_cache
 
 class BingWallpaperApp:
     """Clase principal de la aplicación."""
@@ -20,6 +20,7 @@ class BingWallpaperApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)  # Permite ejecutar en segundo plano
+        QPixmapCache.setCacheLimit(Constants.UI.PIXMAP_CACHE_LIMIT)
         
         self.wallpaper_manager = WallpaperManager()
         self.navigator_window = None
@@ -85,6 +86,7 @@ class BingWallpaperApp:
                 
                 # Guarda la imagen
                 img.save(str(icon_path))
+                clear_file_exists_cache()
             except Exception as e:
                 log_error(f"Error al crear icono: {str(e)}")
         
@@ -113,9 +115,13 @@ class BingWallpaperApp:
         startup_action = QAction("Iniciar con Windows", self.app)
         startup_action.setCheckable(True)
         startup_action.setChecked(StartupManager.get_run_on_startup())
-        startup_action.triggered.connect(lambda checked: StartupManager.set_run_on_startup(checked))
+        startup_action.triggered.connect(StartupManager.set_run_on_startup)
         tray_menu.addAction(startup_action)
         
+        # El estado puede cambiar desde el navegador; StartupManager lo guarda en memoria,
+        # así que refrescarlo al abrir el menú no consulta el registro
+        tray_menu.aboutToShow.connect(lambda: startup_action.setChecked(StartupManager.get_run_on_startup()))
+        
         tray_menu.addSeparator()
         
         # Acción para salir
@@ -3,6 +3,12 @@ import json
 from pathlib import Path
 from PyQt5.QtCore import QLocale
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson es opcional; si no está se usa json estándar
+    _loads = json.loads
+
 # Variable global para idioma actual
 CURRENT_LANGUAGE = None
 
@@ -65,17 +71,14 @@ def set_language(language_code: str) -> bool:
 def load_translations() -> None:
     base_path = get_translations_path()
     
-    # Cargar traducciones españolas
-    es_path = base_path / "translations_es.json"
-    if es_path.exists():
-        with open(es_path, 'r', encoding='utf-8') as f:
-            TRANSLATIONS['es'] = json.load(f)
-    
-    # Cargar traducciones inglesas
-    en_path = base_path / "translations_en.json"
-    if en_path.exists():
-        with open(en_path, 'r', encoding='utf-8') as f:
-            TRANSLATIONS['en'] = json.load(f)
+    # Cargar traducciones españolas e inglesas; cada archivo se lee de una vez
+    # y un archivo ausente o inválido deja el diccionario vacío
+    for language in ('es', 'en'):
+        json_file = base_path / f"translations_{language}.json"
+        try:
+            TRANSLATIONS[language] = _loads(json_file.read_bytes())
+        except (OSError, ValueError):
+            pass
 
 def tr(text: str, context: str = "Constants") -> str:
     """
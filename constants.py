@@ -82,14 +82,44 @@ class Constants:
         
         # Límite de caracteres para título
         TITLE_CHAR_LIMIT_FACTOR = 70
+        
+        # Espera antes de aplicar un cambio de zoom (en milisegundos para QTimer)
+        ZOOM_DEBOUNCE_DELAY = 50
+        
+        # Tiempo máximo de espera de los datos iniciales (en milisegundos para QTimer)
+        INITIAL_LOAD_TIMEOUT = 10000
+        
+        # Memoria máxima de QPixmapCache para las miniaturas (en KB)
+        PIXMAP_CACHE_LIMIT = 32 * 1024
+        
+        # Imágenes originales decodificadas que se guardan para reescalarlas
+        SOURCE_PIXMAP_CACHE_SIZE = 8
+        
+        # Miniaturas escaladas que se conservan en disco
+        SCALED_THUMBNAIL_FILES_LIMIT = 32
 
 
         MAIN_WINDOW_TITLE = "Python Bing Wallpaper Client"
     
     # Constantes de red
     class Network:
-        # Tamaño de chunk para descargar archivos (8KB)
-        DOWNLOAD_CHUNK_SIZE = 8192
+        # Tamaño de chunk para descargar archivos (256KB)
+        DOWNLOAD_CHUNK_SIZE = 256 * 1024
+        
+        # Pool de conexiones de la sesión HTTP compartida
+        POOL_CONNECTIONS = 4
+        POOL_MAXSIZE = 16
+        MAX_RETRIES = 3
+        
+        # Descargas simultáneas de archivos en un lote
+        DOWNLOAD_WORKERS = 8
+        
+        # Hilos del executor del bucle de segundo plano: las descargas de un lote
+        # más la consulta del feed y la carga del historial que pueden esperarlas
+        LOOP_WORKERS = DOWNLOAD_WORKERS + 2
+        
+        # Tiempos máximos de conexión y de lectura de las peticiones HTTP (segundos)
+        REQUEST_TIMEOUT = (10, 30)
         
         # Tiempo de espera entre comprobaciones (segundos)
         CHECK_INTERVAL = 3600  # 1 hora
@@ -98,6 +128,11 @@ class Constants:
         
         # Tiempo de espera para join de threads
         THREAD_JOIN_TIMEOUT = 1.0
+        
+        # Pre-descarga de vecinos durante la navegación
+        PREFETCH_WORKERS = 4
+        PREFETCH_RADIUS = 3
+        PREFETCH_AHEAD = 2
     
     # Constantes de sistema de archivos
     class Files:
@@ -107,9 +142,24 @@ class Constants:
         # Número de wallpapers completos a descargar
         MAX_FULL_WALLPAPERS_TO_DOWNLOAD = 3
         
+        # Número de fechas a conservar en la caché de metadatos
+        METADATA_CACHE_SIZE = 30
+        
+        # Número de URLs cuyos validadores HTTP (ETag / Last-Modified) se conservan
+        VALIDATORS_CACHE_SIZE = 64
+        
+        # Espera antes de guardar el estado tras navegar (en milisegundos para QTimer)
+        STATE_SAVE_DELAY = 300
+        
+        # Espera antes de guardar favoritos tras modificarlos (en milisegundos para QTimer)
+        FAVORITES_SAVE_DELAY = 500
+        
         # Número de separadores para el log
         LOG_SEPARATOR_LENGTH = 40
         
+        # Registros de log acumulados antes de escribirlos al archivo
+        LOG_BUFFER_CAPACITY = 256
+        
         # Separador para el log
         LOG_SEPARATOR_CHAR = "="
     
@@ -157,10 +207,42 @@ class Constants:
         return favorites_path
     
     @classmethod
-    def get_state_file(cls):
-        """Obtiene la ruta del archivo de estado."""
+    def get_scaled_thumbnails_path(cls):
+        """Obtiene la ruta para almacenar las miniaturas ya escaladas para la interfaz."""
+        thumbnails_path = cls.get_data_path() / "thumbnails"
+        thumbnails_path.mkdir(exist_ok=True)
+        return thumbnails_path
+    
+    @classmethod
+    def get_scaled_thumbnail_file(cls, source_file, width, height):
+        """Obtiene la ruta de la miniatura escalada a un tamaño para una imagen de origen."""
+        return cls.get_scaled_thumbnails_path() / f"{Path(source_file).stem}_{width}x{height}.png"
+    
+    @classmethod
+    def get_state_hot_file(cls):
+        """Obtiene la ruta del archivo de estado con los campos que cambian a menudo."""
         return cls.get_data_path() / "state.json"
     
+    @classmethod
+    def get_state_cold_file(cls):
+        """Obtiene la ruta del archivo de estado con el historial de wallpapers."""
+        return cls.get_data_path() / "history.json"
+    
+    @classmethod
+    def get_validators_file(cls):
+        """Obtiene la ruta del archivo con los validadores HTTP de los archivos descargados."""
+        return cls.get_data_path() / "etags.json"
+    
+    @classmethod
+    def get_dated_wallpaper_file(cls, date_str):
+        """Obtiene la ruta del fondo de pantalla descargado para una fecha (YYYYMMDD)."""
+        return cls.get_wallpapers_path() / f"{date_str}.jpg"
+    
+    @classmethod
+    def get_dated_thumbnail_file(cls, date_str):
+        """Obtiene la ruta de la miniatura descargada para una fecha (YYYYMMDD)."""
+        return cls.get_wallpapers_path() / f"{date_str}_thumb.jpg"
+    
     @classmethod
     def get_wallpaper_file(cls, idx=0):
         """Obtiene la ruta del archivo de fondo de pantalla."""
@@ -169,14 +251,6 @@ class Constants:
         else:
             return cls.get_wallpapers_path() / f"wallpaper_{idx}.jpg"
     
-    @classmethod
-    def get_thumbnail_file(cls, idx=0):
-        """Obtiene la ruta del archivo de miniatura."""
-        if idx == 0:
-            return cls.get_wallpapers_path() / "current_thumb.jpg"
-        else:
-            return cls.get_wallpapers_path() / f"wallpaper_{idx}_thumb.jpg"
-    
     @classmethod
     def get_log_file(cls):
         """Obtiene la ruta del archivo de log."""
@@ -215,4 +289,9 @@ class Constants:
     @staticmethod
     def get_bing_website_url():
         """Obtiene la URL del sitio web de Bing Wallpaper."""
-        return "https://www.bing.com/wallpaper"
\ No newline at end of file
+        return "https://www.bing.com/wallpaper"
+
+
+# Prefijos y sufijos precalculados para construir URLs concatenando cadenas
+PICTURE_URL_PREFIX, PICTURE_URL_SUFFIX = Constants.get_picture_url_format().split("{0}")
+THUMBNAIL_URL_PREFIX, THUMBNAIL_URL_SUFFIX = Constants.get_thumbnail_url_format().split("{0}")
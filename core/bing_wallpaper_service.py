@@ -1,23 +1,41 @@
 import os
-import time
-import ctypes
-import winreg
+import asyncio
 import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from pathlib import Path
 import xml.etree.ElementTree as ET
 from PyQt5.QtCore import QObject, pyqtSignal
 
-from constants import Constants
+from constants import (Constants, PICTURE_URL_PREFIX, PICTURE_URL_SUFFIX,
+                       THUMBNAIL_URL_PREFIX, THUMBNAIL_URL_SUFFIX)
 from core.wallpaper_favorites import WallpaperFavorites
 from utils.logger import log_error, log_info
-from utils.file_utils import read_json, write_json, file_exists
-from utils.http_client import download_file, download_content, download_binary
+from utils.file_utils import read_json, write_json, file_exists, list_file_names
+from utils.http_client import (download_file, download_content, download_content_conditional,
+                               download_binary, flush_validators)
+from utils.async_downloader import download_many
 from core.navigation_controller import NavigationController
 
-class WallpaperManager(QObject):
-    """Gestiona la descarga y actualización del fondo de pantalla usando nombres basados en la fecha
-       y un enlace simbólico para el wallpaper actual.
+# SystemParametersInfoW se resuelve en la primera llamada a set_wallpaper
+_system_parameters_info = None
+
+def _get_system_parameters_info():
     """
+    Obtiene (y cachea) la función SystemParametersInfoW de user32 con su firma
+    declarada, para no resolver los tipos de los argumentos en cada llamada.
+    """
+    global _system_parameters_info
+    if _system_parameters_info is None:
+        import ctypes
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        function = user32.SystemParametersInfoW
+        function.argtypes = [ctypes.c_uint, ctypes.c_uint, ctypes.c_wchar_p, ctypes.c_uint]
+        function.restype = ctypes.c_int
+        _system_parameters_info = function
+    return _system_parameters_info
+
+class WallpaperManager(QObject):
+    """Gestiona la descarga y actualización del fondo de pantalla usando nombres basados en la fecha."""
     # Señales Qt
     wallpaper_changed = pyqtSignal(dict)   # Emitida cuando cambia el fondo
     download_completed = pyqtSignal(dict)    # Emitida cuando se completa una descarga
@@ -31,29 +49,52 @@ class WallpaperManager(QObject):
         """Inicializa el gestor de fondos de pantalla."""
         super().__init__()
 
+        self._history_dirty = False
         self.state = self.load_state()
+        self.remove_legacy_current_link()
         self.zoom_factor = self.state.get("zoom_factor", Constants.DEFAULT_ZOOM_FACTOR)
-        self.running = False
-        self.thread = None
+        self._poll_future = None
         self.wallpaper_history = []
+        self._wallpapers_by_date = self.state.get("wallpapers_by_date", {})
         self.favorites = []
         self.current_wallpaper_index = 0
         self.current_source = self.SOURCE_BING  # Fuente predeterminada
 
         # Crear controlador de navegación
         self.navigation_controller = NavigationController(self)
-        self.navigation_controller.wallpaper_changed.connect(
-            lambda wallpaper: self.wallpaper_changed.emit(wallpaper)
+        # Señal conectada a señal: se reenvía sin pasar por Python
+        self.navigation_controller.wallpaper_changed.connect(self.wallpaper_changed)
+
+        # Bucle asyncio en un único hilo para toda la E/S en segundo plano
+        self._loop = asyncio.new_event_loop()
+        # Executor propio y acotado para poder detenerlo descartando el trabajo en cola
+        self._executor = ThreadPoolExecutor(
+            max_workers=Constants.Network.LOOP_WORKERS,
+            thread_name_prefix="wallpaper-loop"
         )
+        self._loop.set_default_executor(self._executor)
+        # Lote de descargas en curso, para cancelarlo al detener el servicio
+        self._batch_future = None
+        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._loop_thread.start()
 
         # Cargar historial y favoritos en segundo plano
-        threading.Thread(target=self.load_wallpaper_history, daemon=True).start()
+        self._loop.call_soon_threadsafe(self._loop.run_in_executor, None, self.load_wallpaper_history)
         self.load_favorites()
 
+    def _run_loop(self):
+        """Ejecuta el bucle de eventos en el hilo de segundo plano."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        # Al detenerse, se completan las tareas canceladas antes de salir del hilo
+        pending = asyncio.all_tasks(self._loop)
+        for task in pending:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
     def load_state(self):
-        """Carga el estado desde el archivo JSON."""
-        state_file = Constants.get_state_file()
-        state = read_json(state_file, None)
+        """Carga el estado combinando el archivo de estado y el de historial."""
+        state = read_json(Constants.get_state_hot_file(), None)
         if not state:
             # Estado por defecto con un campo para la fecha del wallpaper
             state = {
@@ -66,16 +107,44 @@ class WallpaperManager(QObject):
                 "current_index": 0,
                 "zoom_factor": Constants.DEFAULT_ZOOM_FACTOR
             }
+        cold_state = read_json(Constants.get_state_cold_file(), None)
+        if cold_state:
+            state["history"] = cold_state.get("history", [])
+            state["wallpapers_by_date"] = cold_state.get("wallpapers_by_date", {})
+        elif state.get("history"):
+            # Estado de versiones anteriores con el historial en el mismo archivo
+            self._history_dirty = True
         return state
 
+    def remove_legacy_current_link(self):
+        """Elimina el enlace simbólico 'current.jpg' de versiones anteriores, si existe."""
+        current_link = Constants.get_wallpapers_path() / "current.jpg"
+        try:
+            if os.path.islink(current_link):
+                os.remove(current_link)
+        except Exception as e:
+            log_error(f"Error al eliminar enlace simbólico antiguo: {str(e)}")
+
     def save_state(self):
-        """Guarda el estado actual en el archivo JSON."""
+        """
+        Guarda el estado actual. El historial solo se reescribe si cambió
+        desde el último guardado.
+        """
         try:
-            self.state["history"] = self.wallpaper_history
             self.state["current_source"] = self.current_source
             self.state["current_index"] = self.current_wallpaper_index
             self.state["zoom_factor"] = self.zoom_factor
-            write_json(Constants.get_state_file(), self.state)
+            hot_state = {key: value for key, value in self.state.items()
+                         if key not in ("history", "wallpapers_by_date")}
+            write_json(Constants.get_state_hot_file(), hot_state)
+            if self._history_dirty:
+                self.state["history"] = self.wallpaper_history
+                self.state["wallpapers_by_date"] = self._wallpapers_by_date
+                write_json(Constants.get_state_cold_file(), {
+                    "history": self.wallpaper_history,
+                    "wallpapers_by_date": self._wallpapers_by_date
+                })
+                self._history_dirty = False
         except Exception as e:
             log_error(f"Error al guardar el estado: {str(e)}")
 
@@ -94,58 +163,121 @@ class WallpaperManager(QObject):
 
     def start(self):
         """Inicia el proceso de actualización del fondo de pantalla."""
-        if self.thread and self.thread.is_alive():
+        if self._poll_future and not self._poll_future.done():
             return  # Ya está en ejecución
-        self.running = True
-        self.thread = threading.Thread(target=self.run, daemon=True)
-        self.thread.start()
+        self._poll_future = asyncio.run_coroutine_threadsafe(self.run(), self._loop)
 
     def stop(self):
-        """Detiene el proceso de actualización."""
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
+        """
+        Detiene el proceso de actualización, espera a que termine el hilo del
+        bucle y cierra el bucle junto con su executor, sin esperar a las
+        consultas que sigan en curso.
+        """
+        if self._loop.is_closed():
+            return
+        if self._poll_future:
+            self._poll_future.cancel()
+        self.navigation_controller.shutdown()
+        WallpaperFavorites.flush()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=Constants.Network.THREAD_JOIN_TIMEOUT)
+        if self._loop_thread.is_alive():
+            # El bucle sigue en marcha: no se puede cerrar desde este hilo
+            log_error("El hilo del bucle de eventos no terminó a tiempo")
+            return
+        
+        # Descarta las tareas del executor aún en cola sin esperar a las que están en
+        # curso, para no bloquear la interfaz, y cierra el bucle
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._loop.close()
+        # Un lote programado cuando el bucle ya se detenía no llegará a ejecutarse:
+        # se cancela para que no quede esperándolo un hilo del executor
+        batch_future = self._batch_future
+        if batch_future:
+            batch_future.cancel()
 
-    def run(self):
+    async def run(self):
         """Bucle principal que consulta Bing y actualiza el wallpaper según corresponda."""
+        loop = asyncio.get_running_loop()
         first_time = True
-        while self.running:
+        while True:
             try:
-                xml_content = download_content(Constants.get_wallpaper_info_url())
-                if xml_content:
-                    info = self.parse_wallpaper_info(xml_content)
-                    # Si se detecta un nuevo wallpaper o la copia local no existe
-                    if info and (info["picture_url"] != self.state.get("picture_url") or
-                                 not file_exists(Path(self.state.get("picture_file_path", "")))):
-                        self.download_wallpaper(info)
-                    elif first_time:
-                        # En la primera ejecución, se usa el enlace simbólico actual
-                        current_link = Constants.get_wallpapers_path() / "current.jpg"
-                        self.set_wallpaper(str(current_link))
+                # La consulta es bloqueante, así que se delega al executor del bucle
+                if await loop.run_in_executor(None, self.check_for_update, first_time):
                     first_time = False
 
-                # Espera el intervalo configurado antes de volver a consultar
-                for _ in range(Constants.Network.CHECK_INTERVAL):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+                # Espera el intervalo configurado; stop() cancela la espera de inmediato
+                await asyncio.sleep(Constants.Network.CHECK_INTERVAL)
             except Exception as e:
                 log_error(f"Error en el bucle principal: {str(e)}")
-                time.sleep(Constants.Network.RETRY_INTERVAL)
+                await asyncio.sleep(Constants.Network.RETRY_INTERVAL)
+
+    def check_for_update(self, first_time):
+        """
+        Consulta el feed de Bing y descarga el wallpaper si hay uno nuevo.
+        
+        Args:
+            first_time: Si es la primera consulta desde que se inició el proceso
+            
+        Returns:
+            bool: True si se obtuvo respuesta del feed, False en caso contrario
+        """
+        # Solo se envían los validadores si la copia local sigue disponible
+        picture_file_path = self.state.get("picture_file_path")
+        has_local_copy = bool(picture_file_path) and file_exists(Path(picture_file_path))
+        xml_content, etag, last_modified, status = download_content_conditional(
+            Constants.get_wallpaper_info_url(),
+            etag=self.state.get("feed_etag") if has_local_copy else None,
+            last_modified=self.state.get("feed_last_modified") if has_local_copy else None
+        )
+        if status == 304:
+            # El feed no cambió: no hace falta analizar el XML
+            if first_time:
+                self.set_wallpaper(picture_file_path)
+            return True
+        if not xml_content:
+            return False
+
+        info = self.parse_wallpaper_info(xml_content, single=True)
+        # Si se detecta un nuevo wallpaper o la copia local no existe
+        if info and (info["picture_url"] != self.state.get("picture_url") or
+                     not file_exists(Path(self.state.get("picture_file_path", "")))):
+            if not self.download_wallpaper(info):
+                # Sin guardar los validadores, la siguiente consulta vuelve a pedir el feed
+                return True
+        elif first_time and self.state.get("picture_file_path"):
+            # En la primera ejecución, se reaplica el último wallpaper descargado
+            self.set_wallpaper(self.state["picture_file_path"])
 
-    def parse_wallpaper_info(self, xml_content):
-        """Analiza el XML de Bing y extrae la información relevante del wallpaper."""
+        # Los validadores solo se guardan cuando el wallpaper del feed ya está descargado
+        if info and (etag, last_modified) != (self.state.get("feed_etag"), self.state.get("feed_last_modified")):
+            self.state["feed_etag"] = etag
+            self.state["feed_last_modified"] = last_modified
+            self.save_state()
+        return True
+
+    def parse_wallpaper_info(self, xml_content, single=False):
+        """
+        Analiza el XML de Bing y extrae la información relevante del wallpaper.
+        
+        Args:
+            xml_content: Contenido XML del feed de Bing
+            single: Si es True, solo se analiza la primera imagen y se retorna su diccionario
+            
+        Returns:
+            dict, list o None: Diccionario de la primera imagen si single es True,
+            lista de diccionarios en caso contrario, o None si hubo un error
+        """
         try:
             root = ET.fromstring(xml_content)
-            images = root.findall(".//image")
             wallpapers = []
-            for image in images:
+            for image in root.iter("image"):
                 url_base = image.find("urlBase").text
                 copyright_text = image.find("copyright").text
                 start_date = image.find("startdate").text  # Formato: YYYYMMDD
                 # Usamos directamente start_date para nombrar los archivos
-                picture_url = Constants.get_picture_url_format().format(url_base)
-                thumbnail_url = Constants.get_thumbnail_url_format().format(url_base)
+                picture_url = PICTURE_URL_PREFIX + url_base + PICTURE_URL_SUFFIX
+                thumbnail_url = THUMBNAIL_URL_PREFIX + url_base + THUMBNAIL_URL_SUFFIX
                 wallpapers.append({
                     "picture_url": picture_url,
                     "thumbnail_url": thumbnail_url,
@@ -153,16 +285,51 @@ class WallpaperManager(QObject):
                     "date": start_date,  # Ej: "20250409"
                     "source": self.SOURCE_BING
                 })
-            if len(wallpapers) == 1:
-                return wallpapers[0]
-            return wallpapers
+                if single:
+                    return wallpapers[0]
+            return None if single else wallpapers
         except Exception as e:
             log_error(f"Error al analizar información de wallpaper: {str(e)}")
             return None
 
-    def load_favorites(self):
-        """Carga la lista de wallpapers favoritos."""
-        self.favorites = WallpaperFavorites.get_favorites_list()
+    def load_favorites(self, changed=False):
+        """
+        Carga la lista de wallpapers favoritos. La caché de favoritos no
+        duplicados solo se descarta si la lista se volvió a leer del archivo o
+        si 'changed' indica que se agregó o eliminó un favorito.
+        """
+        favorites = WallpaperFavorites.get_favorites_list()
+        if changed or favorites is not self.favorites:
+            self.favorites = favorites
+            self.navigation_controller.invalidate_duplicate_cache()
+
+    def merge_wallpaper_metadata(self, wallpapers, days):
+        """
+        Combina los metadatos recibidos en la caché indexada por fecha y
+        reconstruye el historial con las 'days' fechas más recientes.
+        
+        Returns:
+            bool: True si la caché cambió, False en caso contrario
+        """
+        cache = self._wallpapers_by_date
+        changed = False
+        for wallpaper in wallpapers:
+            if cache.get(wallpaper["date"]) != wallpaper:
+                cache[wallpaper["date"]] = wallpaper
+                changed = True
+        
+        # Descarta las fechas más antiguas que exceden el tamaño de la caché
+        dates = sorted(cache, reverse=True)
+        for date_str in dates[Constants.Files.METADATA_CACHE_SIZE:]:
+            del cache[date_str]
+            changed = True
+        
+        history = [cache[date_str] for date_str in dates[:days]]
+        if history != self.wallpaper_history:
+            self.wallpaper_history = history
+            self.navigation_controller.invalidate_duplicate_cache()
+            changed = True
+        return changed
 
     def load_wallpaper_history(self, days=None):
         """Carga el historial de wallpapers de los últimos 'days' días."""
@@ -171,67 +338,126 @@ class WallpaperManager(QObject):
         try:
             if "history" in self.state and self.state["history"]:
                 self.wallpaper_history = self.state["history"]
+                self.navigation_controller.invalidate_duplicate_cache()
 
             xml_content = download_content(Constants.get_wallpaper_info_url(0, days))
             if xml_content:
                 wallpapers = self.parse_wallpaper_info(xml_content)
                 if wallpapers:
-                    self.wallpaper_history = wallpapers
+                    if self.merge_wallpaper_metadata(wallpapers, days):
+                        self._history_dirty = True
+                    # Una sola lectura del directorio en lugar de un stat por archivo
+                    wallpapers_path = Constants.get_wallpapers_path()
+                    existing = list_file_names(wallpapers_path)
+                    # Las descargas pendientes se hacen en un solo lote concurrente,
+                    # con las miniaturas primero para que el navegador las tenga antes
+                    pending_thumbs = []
+                    pending = []
                     for wallpaper in self.wallpaper_history:
                         date_str = wallpaper["date"]
-                        thumb_file = Constants.get_wallpapers_path() / f"{date_str}_thumb.jpg"
-                        wallpaper_file = Constants.get_wallpapers_path() / f"{date_str}.jpg"
-                        if not file_exists(thumb_file) and "thumbnail_url" in wallpaper:
-                            download_file(wallpaper["thumbnail_url"], thumb_file)
-                        if not file_exists(wallpaper_file) and "picture_url" in wallpaper:
-                            download_file(wallpaper["picture_url"], wallpaper_file)
+                        thumb_file = Constants.get_dated_thumbnail_file(date_str)
+                        wallpaper_file = Constants.get_dated_wallpaper_file(date_str)
+                        if thumb_file.name not in existing and "thumbnail_url" in wallpaper:
+                            pending_thumbs.append((wallpaper["thumbnail_url"], thumb_file))
+                        if wallpaper_file.name not in existing and "picture_url" in wallpaper:
+                            pending.append((wallpaper["picture_url"], wallpaper_file))
+                    self.download_batch(pending_thumbs + pending)
                     self.save_state()
             self.load_favorites()
         except Exception as e:
             log_error(f"Error al cargar historial de wallpapers: {str(e)}")
 
+    def download_batch(self, pairs):
+        """
+        Descarga un lote de archivos en el bucle de segundo plano y espera su
+        resultado. Se llama desde el executor del bucle, nunca desde su hilo.
+        
+        Args:
+            pairs: Lista de tuplas (url, ruta de destino)
+            
+        Returns:
+            list: Lista de bool con el resultado de cada descarga; vacía si se canceló
+        """
+        if not pairs:
+            return []
+        future = asyncio.run_coroutine_threadsafe(download_many(pairs), self._loop)
+        self._batch_future = future
+        try:
+            return future.result()
+        except CancelledError:
+            log_info("Descarga del lote cancelada")
+            return []
+        finally:
+            self._batch_future = None
+            flush_validators()
+
     def download_wallpaper(self, info):
         """
-        Descarga el wallpaper y su miniatura usando la fecha como parte del nombre.
-        Luego, actualiza el enlace simbólico 'current.jpg' para apuntar al nuevo wallpaper.
+        Descarga el wallpaper y su miniatura usando la fecha como parte del nombre
+        y lo establece directamente como fondo de pantalla.
+        
+        Returns:
+            bool: True si el wallpaper se descargó, False en caso contrario
         """
         try:
             date_str = info["date"]  # Ejemplo: "20250409"
-            wallpaper_file = Constants.get_wallpapers_path() / f"{date_str}.jpg"
-            if download_file(info["picture_url"], wallpaper_file):
-                thumb_file = Constants.get_wallpapers_path() / f"{date_str}_thumb.jpg"
-                download_file(info["thumbnail_url"], thumb_file)
-                # Actualizar el enlace simbólico "current.jpg"
-                current_link = Constants.get_wallpapers_path() / "current.jpg"
-                if os.path.exists(current_link) or os.path.islink(current_link):
-                    os.remove(current_link)
-                os.symlink(wallpaper_file, current_link)
-                # Establecer el wallpaper utilizando el enlace simbólico
-                self.set_wallpaper(str(current_link))
+            wallpaper_file = Constants.get_dated_wallpaper_file(date_str)
+            # El lote del historial suele haber descargado ya estos archivos:
+            # solo se vuelven a transferir si cambiaron en el servidor
+            if download_file(info["picture_url"], wallpaper_file, revalidate=True):
+                thumb_file = Constants.get_dated_thumbnail_file(date_str)
+                download_file(info["thumbnail_url"], thumb_file, revalidate=True)
+                flush_validators()
+                # Establecer el wallpaper usando directamente el archivo fechado
+                self.set_wallpaper(str(wallpaper_file))
                 # Actualizar el estado
                 self.state["picture_url"] = info["picture_url"]
                 self.state["picture_date"] = date_str
                 self.state["picture_file_path"] = str(wallpaper_file)
                 self.state["copyright"] = info["copyright"]
+                self._history_dirty = True
                 if not self.wallpaper_history or self.wallpaper_history[0]["picture_url"] != info["picture_url"]:
                     self.load_wallpaper_history()
                 self.save_state()
                 self.download_completed.emit(self.state)
+                return True
         except Exception as e:
             log_error(f"Error al descargar el fondo de pantalla: {str(e)}")
+        return False
 
-    def set_wallpaper(self, wallpaper_path):
-        """Establece la imagen como fondo de pantalla en Windows utilizando la API del sistema."""
-        wallpaper_path = os.path.abspath(wallpaper_path)
+    def apply_wallpaper_style(self):
+        """
+        Configura en el registro el estilo del fondo de pantalla. Solo accede al
+        registro si el estilo guardado en el estado difiere del configurado.
+        """
+        style = [Constants.Windows.WALLPAPER_STYLE_FIT, Constants.Windows.WALLPAPER_TILE]
+        if self.state.get("wallpaper_style") == style:
+            return
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Control Panel\\Desktop", 0, winreg.KEY_SET_VALUE)
-            winreg.SetValueEx(key, "WallpaperStyle", 0, winreg.REG_SZ, Constants.Windows.WALLPAPER_STYLE_FIT)
-            winreg.SetValueEx(key, "TileWallpaper", 0, winreg.REG_SZ, Constants.Windows.WALLPAPER_TILE)
-            winreg.CloseKey(key)
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Control Panel\\Desktop", 0,
+                                 winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE)
+            try:
+                # Solo se escribe en el registro si el valor cambió
+                for name, value in zip(("WallpaperStyle", "TileWallpaper"), style):
+                    try:
+                        current_value, _ = winreg.QueryValueEx(key, name)
+                    except FileNotFoundError:
+                        current_value = None
+                    if current_value != value:
+                        winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
+            finally:
+                winreg.CloseKey(key)
+            self.state["wallpaper_style"] = style
         except Exception as e:
             log_error(f"Error al configurar el estilo del fondo: {str(e)}")
+
+    def set_wallpaper(self, wallpaper_path):
+        """Establece la imagen como fondo de pantalla en Windows utilizando la API del sistema."""
+        wallpaper_path = os.path.abspath(wallpaper_path)
+        self.apply_wallpaper_style()
         try:
-            ctypes.windll.user32.SystemParametersInfoW(
+            _get_system_parameters_info()(
                 Constants.Windows.SPI_SETDESKWALLPAPER, 0, wallpaper_path,
                 Constants.Windows.SPIF_UPDATEINIFILE | Constants.Windows.SPIF_SENDCHANGE
             )
@@ -252,7 +478,7 @@ class WallpaperManager(QObject):
         return self.navigation_controller.navigate_to_next()
 
     def get_current_wallpaper(self):
-        """Obtiene la información del wallpaper actual, usando el enlace simbólico 'current.jpg'."""
+        """Obtiene la información del wallpaper actual."""
         self.load_favorites()  # Actualiza la lista de favoritos
         if self.current_source == self.SOURCE_BING:
             if not self.wallpaper_history or self.current_wallpaper_index >= len(self.wallpaper_history):
@@ -261,8 +487,8 @@ class WallpaperManager(QObject):
             current["current_index"] = self.current_wallpaper_index
             current["total_images"] = len(self.wallpaper_history)
             current["source_name"] = "Bing Wallpaper"
-            # Siempre se usa el enlace simbólico para el wallpaper actual
-            current["file_path"] = str(Constants.get_wallpapers_path() / "current.jpg")
+            # Ruta del archivo fechado descargado para este wallpaper
+            current["file_path"] = str(Constants.get_dated_wallpaper_file(current["date"]))
             return current
         else:
             if not self.favorites or self.current_wallpaper_index >= len(self.favorites):
@@ -292,12 +518,15 @@ class WallpaperManager(QObject):
             return True
         result = WallpaperFavorites.add_to_favorites(current)
         if result:
-            self.load_favorites()
+            self.load_favorites(changed=True)
         return result
 
     def remove_from_favorites(self, favorite_id):
         """Elimina un wallpaper de favoritos."""
         result = WallpaperFavorites.remove_from_favorites(favorite_id)
+        if result:
+            # La lista se modifica en el sitio: se descarta la caché antes de navegar
+            self.load_favorites(changed=True)
         if result and self.current_source == self.SOURCE_FAVORITE:
             current = self.get_current_wallpaper()
             if current and current.get("id") == favorite_id:
@@ -305,7 +534,6 @@ class WallpaperManager(QObject):
                     if not self.navigate_to_previous_wallpaper():
                         if self.wallpaper_history:
                             self.navigate_to_wallpaper(0, self.SOURCE_BING)
-        self.load_favorites()
         return result
 
     def is_current_favorite(self):
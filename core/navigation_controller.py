@@ -1,4 +1,7 @@
-from PyQt5.QtCore import QObject, pyqtSignal
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from constants import Constants
 from utils.logger import log_error, log_info
 from utils.http_client import download_file
@@ -19,6 +22,38 @@ class NavigationController(QObject):
         """Inicializa el controlador de navegación."""
         super().__init__()
         self.wallpaper_manager = wallpaper_manager
+        
+        # Pool para pre-descargar vecinos sin bloquear la navegación
+        self._prefetch_pool = ThreadPoolExecutor(
+            max_workers=Constants.Network.PREFETCH_WORKERS,
+            thread_name_prefix="prefetch"
+        )
+        # Descargas en curso por URL, compartidas entre navegación y pre-descarga
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Índices ordenados de favoritos que no duplican un wallpaper de Bing
+        self._non_duplicate_favorites = None
+        
+        # Guardado diferido del estado para agrupar clics rápidos de navegación
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(Constants.Files.STATE_SAVE_DELAY)
+        self._save_timer.timeout.connect(self.wallpaper_manager.save_state)
+    
+    def invalidate_duplicate_cache(self):
+        """Descarta la caché de favoritos no duplicados tras cambiar favoritos o historial."""
+        self._non_duplicate_favorites = None
+    
+    def shutdown(self):
+        """
+        Guarda el estado pendiente y detiene el pool de pre-descarga
+        descartando los trabajos pendientes.
+        """
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.wallpaper_manager.save_state()
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
     
     def navigate_to_wallpaper(self, index, source=None):
         """
@@ -42,7 +77,8 @@ class NavigationController(QObject):
                 return False
             
             wallpaper = collection[index]
-            wallpaper_file = Constants.get_wallpaper_file(index)
+            # Mismo archivo fechado que descarga el historial
+            wallpaper_file = Constants.get_dated_wallpaper_file(wallpaper["date"])
         else:  # SOURCE_FAVORITE
             collection = self.wallpaper_manager.favorites
             if not collection or index < 0 or index >= len(collection):
@@ -51,17 +87,14 @@ class NavigationController(QObject):
             wallpaper = collection[index]
             wallpaper_file = Path(wallpaper.get("file_path", ""))
         
-        # Verifica si el archivo existe o lo descarga si es necesario
-        self._ensure_wallpaper_file(wallpaper_file, wallpaper, index, source)
-        
-        # Si el archivo aún no existe, la navegación falló
-        if not file_exists(wallpaper_file):
+        # Verifica si el archivo existe o lo descarga; si no se consigue, la navegación falló
+        if not self._ensure_wallpaper_file(wallpaper_file, wallpaper, index, source):
             return False
         
         # Actualiza el estado
         self.wallpaper_manager.current_wallpaper_index = index
         self.wallpaper_manager.current_source = source
-        self.wallpaper_manager.save_state()
+        self._save_timer.start()
         
         # Establece el fondo de pantalla
         self.wallpaper_manager.set_wallpaper(str(wallpaper_file))
@@ -71,98 +104,126 @@ class NavigationController(QObject):
         
         return True
     
-    def _is_favorite_duplicate(self, favorite_index):
+    def _get_non_duplicate_favorites(self):
         """
-        Verifica si un favorito ya existe en la colección de Bing.
+        Obtiene los índices de favoritos cuya URL no está en la colección de Bing.
         
-        Args:
-            favorite_index: Índice del favorito a verificar
-            
         Returns:
-            bool: True si el favorito es un duplicado, False en caso contrario
+            list: Índices ordenados de favoritos no duplicados
         """
-        # Validar que existe la colección y el índice
-        if (not self.wallpaper_manager.favorites or 
-            favorite_index < 0 or 
-            favorite_index >= len(self.wallpaper_manager.favorites)):
-            return False
-            
-        # Obtener el favorito a verificar
-        favorite = self.wallpaper_manager.favorites[favorite_index]
-        favorite_url = favorite.get("picture_url", "")
-        
-        if not favorite_url:
-            return False
-            
-        # Buscar si existe la misma URL en la colección de Bing
-        for bing_wallpaper in self.wallpaper_manager.wallpaper_history:
-            if bing_wallpaper.get("picture_url", "") == favorite_url:
-                return True
-                
-        return False
+        if self._non_duplicate_favorites is None:
+            bing_urls = {
+                wallpaper.get("picture_url", "")
+                for wallpaper in self.wallpaper_manager.wallpaper_history
+            }
+            self._non_duplicate_favorites = [
+                index for index, favorite in enumerate(self.wallpaper_manager.favorites)
+                if not favorite.get("picture_url", "") or favorite.get("picture_url") not in bing_urls
+            ]
+        return self._non_duplicate_favorites
     
     def _find_next_non_duplicate_favorite(self, start_index, direction=1):
         """
         Encuentra el siguiente favorito que no sea duplicado de Bing.
         
         Args:
-            start_index: Índice inicial para buscar
+            start_index: Índice inicial para buscar (incluido)
             direction: 1 para buscar hacia adelante, -1 para buscar hacia atrás
             
         Returns:
             int or None: Índice del siguiente favorito no duplicado, o None si no hay más
         """
-        favorites = self.wallpaper_manager.favorites
+        non_duplicates = self._get_non_duplicate_favorites()
         
-        if not favorites:
-            return None
-            
-        # Calcular límites
-        end_index = len(favorites) if direction > 0 else -1
-        
-        # Buscar el siguiente favorito no duplicado
-        current_index = start_index
-        while current_index != end_index:
-            if not self._is_favorite_duplicate(current_index):
-                return current_index
-            current_index += direction
-            
+        if direction > 0:
+            position = bisect_left(non_duplicates, start_index)
+            return non_duplicates[position] if position < len(non_duplicates) else None
+        
+        position = bisect_right(non_duplicates, start_index) - 1
+        return non_duplicates[position] if position >= 0 else None
+    
+    def _older_from_bing(self, index):
+        """Destino al retroceder desde la colección de Bing."""
+        # Si podemos retroceder en la colección de Bing
+        if index < len(self.wallpaper_manager.wallpaper_history) - 1:
+            return self.SOURCE_BING, index + 1
+        # Si estamos al final de la colección de Bing pero existen favoritos
+        if self.wallpaper_manager.favorites:
+            # Buscar el primer favorito que no sea duplicado de Bing
+            favorite_index = self._find_next_non_duplicate_favorite(0)
+            if favorite_index is not None:
+                return self.SOURCE_FAVORITE, favorite_index
         return None
     
-    def navigate_to_previous(self):
+    def _older_from_favorite(self, index):
+        """Destino al retroceder desde la colección de favoritos."""
+        if index < len(self.wallpaper_manager.favorites) - 1:
+            # Buscar el siguiente favorito que no sea duplicado
+            favorite_index = self._find_next_non_duplicate_favorite(index + 1)
+            if favorite_index is not None:
+                return self.SOURCE_FAVORITE, favorite_index
+        return None
+    
+    def _newer_from_favorite(self, index):
+        """Destino al avanzar desde la colección de favoritos."""
+        if index > 0:
+            # Buscar el favorito anterior que no sea duplicado
+            favorite_index = self._find_next_non_duplicate_favorite(index - 1, -1)
+            if favorite_index is not None:
+                return self.SOURCE_FAVORITE, favorite_index
+        # Si estamos al inicio de favoritos pero existe colección de Bing
+        elif self.wallpaper_manager.wallpaper_history:
+            return self.SOURCE_BING, len(self.wallpaper_manager.wallpaper_history) - 1
+        return None
+    
+    def _newer_from_bing(self, index):
+        """Destino al avanzar desde la colección de Bing."""
+        if index > 0:
+            return self.SOURCE_BING, index - 1
+        return None
+    
+    # Transiciones por (fuente actual, dirección): 1 hacia los más antiguos, -1 hacia los más recientes
+    _STEP_TRANSITIONS = {
+        (SOURCE_BING, 1): _older_from_bing,
+        (SOURCE_FAVORITE, 1): _older_from_favorite,
+        (SOURCE_FAVORITE, -1): _newer_from_favorite,
+        (SOURCE_BING, -1): _newer_from_bing,
+    }
+    
+    def _step(self, direction):
         """
-        Navega al wallpaper anterior (más antiguo).
+        Navega un paso en la dirección indicada, pasando de una colección a
+        otra en los extremos.
         
+        Args:
+            direction: 1 hacia los más antiguos, -1 hacia los más recientes
+            
         Returns:
             bool: True si la navegación fue exitosa, False en caso contrario
         """
         source = self.wallpaper_manager.current_source
-        index = self.wallpaper_manager.current_wallpaper_index
+        transition = self._STEP_TRANSITIONS.get((source, direction))
+        if transition is None:
+            # Fuente desconocida: se trata como favoritos al retroceder y como Bing al avanzar
+            fallback = self.SOURCE_FAVORITE if direction > 0 else self.SOURCE_BING
+            transition = self._STEP_TRANSITIONS[(fallback, direction)]
         
-        # Pre-descarga miniaturas para navegación más fluida
-        self._preload_thumbnail(index + 1, source)
+        target = transition(self, self.wallpaper_manager.current_wallpaper_index)
+        if target is None:
+            # No se puede navegar más allá
+            return False
         
-        # Intenta navegar primero dentro de la colección actual
-        if source == self.SOURCE_BING:
-            # Si podemos retroceder en la colección de Bing
-            if index < len(self.wallpaper_manager.wallpaper_history) - 1:
-                return self.navigate_to_wallpaper(index + 1, source)
-            # Si estamos al final de la colección de Bing pero existen favoritos
-            elif self.wallpaper_manager.favorites:
-                # Buscar el primer favorito que no sea duplicado de Bing
-                next_favorite_index = self._find_next_non_duplicate_favorite(0)
-                if next_favorite_index is not None:
-                    return self.navigate_to_wallpaper(next_favorite_index, self.SOURCE_FAVORITE)
-        else:  # En favoritos
-            # Si podemos retroceder en la colección de favoritos
-            if index < len(self.wallpaper_manager.favorites) - 1:
-                # Buscar el siguiente favorito que no sea duplicado
-                next_favorite_index = self._find_next_non_duplicate_favorite(index + 1)
-                if next_favorite_index is not None:
-                    return self.navigate_to_wallpaper(next_favorite_index, source)
-        
-        # No se puede navegar más allá
-        return False
+        target_source, target_index = target
+        return self._navigate_and_prefetch(target_index, target_source, direction)
+    
+    def navigate_to_previous(self):
+        """
+        Navega al wallpaper anterior (más antiguo).
+        
+        Returns:
+            bool: True si la navegación fue exitosa, False en caso contrario
+        """
+        return self._step(1)
     
     def navigate_to_next(self):
         """
@@ -171,56 +232,111 @@ class NavigationController(QObject):
         Returns:
             bool: True si la navegación fue exitosa, False en caso contrario
         """
-        source = self.wallpaper_manager.current_source
-        index = self.wallpaper_manager.current_wallpaper_index
-        
-        # Pre-descarga miniaturas para navegación más fluida
-        self._preload_thumbnail(index - 1, source)
-        
-        # Intenta navegar primero dentro de la colección actual
-        if source == self.SOURCE_FAVORITE:
-            # Si podemos avanzar en la colección de favoritos
-            if index > 0:
-                # Buscar el favorito anterior que no sea duplicado
-                next_favorite_index = self._find_next_non_duplicate_favorite(index - 1, -1)
-                if next_favorite_index is not None:
-                    return self.navigate_to_wallpaper(next_favorite_index, source)
-            # Si estamos al inicio de favoritos pero existe colección de Bing
-            elif self.wallpaper_manager.wallpaper_history:
-                return self.navigate_to_wallpaper(
-                    len(self.wallpaper_manager.wallpaper_history) - 1, 
-                    self.SOURCE_BING
-                )
-        else:  # En Bing
-            # Si podemos avanzar en la colección de Bing
-            if index > 0:
-                return self.navigate_to_wallpaper(index - 1, source)
-        
-        # No se puede navegar más allá
-        return False
+        return self._step(-1)
+    
+    def _navigate_and_prefetch(self, index, source, direction):
+        """
+        Navega a un wallpaper y pre-descarga en segundo plano sus vecinos.
+        
+        Args:
+            index: Índice dentro de la colección
+            source: Fuente del wallpaper
+            direction: 1 si se recorre hacia los más antiguos, -1 hacia los más recientes
+            
+        Returns:
+            bool: True si la navegación fue exitosa, False en caso contrario
+        """
+        if not self.navigate_to_wallpaper(index, source):
+            return False
+        self._preload_window(index, source, direction)
+        return True
     
     def _ensure_wallpaper_file(self, file_path, wallpaper, index, source):
-        """Asegura que exista el archivo de wallpaper, descargándolo si es necesario."""
-        if not file_exists(file_path) and source == self.SOURCE_BING:
-            # Solo descarga para la fuente Bing
-            if "picture_url" in wallpaper:
-                log_info(f"Descargando wallpaper para índice {index}...")
-                download_file(
-                    wallpaper["picture_url"], 
-                    file_path
-                )
-    
-    def _preload_thumbnail(self, index, source):
-        """Pre-descarga miniatura para navegación más fluida."""
-        if source == self.SOURCE_BING and index >= 0:
-            collection = self.wallpaper_manager.wallpaper_history
-            if index < len(collection):
-                wallpaper = collection[index]
-                thumb_file = Constants.get_thumbnail_file(index)
-                
-                if not file_exists(thumb_file) and "thumbnail_url" in wallpaper:
-                    log_info(f"Pre-descargando miniatura para índice {index}...")
-                    download_file(
-                        wallpaper["thumbnail_url"], 
-                        thumb_file
-                    )
\ No newline at end of file
+        """
+        Asegura que exista el archivo de wallpaper, descargándolo si es necesario.
+        La descarga se hace directamente, sin pasar por la cola de pre-descarga;
+        si esa descarga ya está en curso, download_file espera su resultado en
+        lugar de repetirla.
+        
+        Returns:
+            bool: True si el archivo está disponible, False en caso contrario
+        """
+        if file_exists(file_path):
+            return True
+        
+        # Solo descarga para la fuente Bing
+        if source != self.SOURCE_BING or "picture_url" not in wallpaper:
+            return False
+        
+        # Una pre-descarga que aún espera en la cola ya no hace falta
+        with self._inflight_lock:
+            future = self._inflight.get(wallpaper["picture_url"])
+        if future is not None:
+            future.cancel()
+        
+        log_info(f"Descargando wallpaper para índice {index}...")
+        return download_file(wallpaper["picture_url"], file_path)
+    
+    def _preload_window(self, center_index, source, direction, radius=Constants.Network.PREFETCH_RADIUS):
+        """
+        Pre-descarga en segundo plano las miniaturas vecinas a un índice y los
+        wallpapers completos siguientes en la dirección del recorrido.
+        
+        Args:
+            center_index: Índice alrededor del cual se pre-descarga
+            source: Fuente del wallpaper (solo se pre-descarga para Bing)
+            direction: 1 si se recorre hacia los más antiguos, -1 hacia los más recientes
+            radius: Número de miniaturas vecinas a cada lado del índice
+        """
+        if source != self.SOURCE_BING:
+            return
+        
+        collection = self.wallpaper_manager.wallpaper_history
+        
+        # Primero los wallpapers completos que probablemente se verán a continuación
+        for step in range(1, Constants.Network.PREFETCH_AHEAD + 1):
+            index = center_index + direction * step
+            if 0 <= index < len(collection):
+                self._submit_prefetch(collection[index].get("picture_url"),
+                                      Constants.get_dated_wallpaper_file(collection[index]["date"]))
+        
+        start = max(0, center_index - radius)
+        end = min(len(collection), center_index + radius + 1)
+        for index in range(start, end):
+            self._submit_prefetch(collection[index].get("thumbnail_url"),
+                                  Constants.get_dated_thumbnail_file(collection[index]["date"]))
+    
+    def _submit_prefetch(self, url, file_path):
+        """Encola en segundo plano la descarga de un archivo si aún no existe."""
+        if not url or file_exists(file_path):
+            return
+        if self._submit_download(url, file_path) is not None:
+            log_info(f"Pre-descargando {file_path.name}...")
+    
+    def _submit_download(self, url, file_path):
+        """
+        Encola la descarga de una URL en el pool, o devuelve la descarga ya en
+        curso para esa URL en lugar de repetirla.
+        
+        Returns:
+            Future o None: Descarga en curso, o None si el pool ya fue detenido
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            if future is not None:
+                return future
+            try:
+                future = self._prefetch_pool.submit(download_file, url, file_path)
+            except RuntimeError:
+                # El pool ya fue detenido
+                return None
+            self._inflight[url] = future
+        
+        future.add_done_callback(lambda done: self._discard_inflight(url, done))
+        return future
+    
+    def _discard_inflight(self, url, future):
+        """Quita una descarga terminada del registro de descargas en curso."""
+        with self._inflight_lock:
+            if self._inflight.get(url) is future:
+                del self._inflight[url]
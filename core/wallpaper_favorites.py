@@ -1,16 +1,37 @@
 import json
+import time
 from datetime import datetime
+from pathlib import Path
+from PyQt5.QtCore import QCoreApplication, QThread, QTimer
 from constants import Constants
 from utils.file_utils import read_json, write_json, copy_file, delete_file, file_exists
 from utils.logger import log_error, log_info
 from utils.resource_utils import open_folder
 
+# Datos de favoritos en memoria, invalidados por la fecha de modificación del archivo
+_cache = {"mtime": -1, "data": None, "url_index": {}}
+
+def _build_url_index(data):
+    """
+    Construye el índice {picture_url: id} de los favoritos. Con URLs repetidas
+    se queda el primero, igual que una búsqueda lineal.
+    """
+    index = {}
+    for favorite in data["favorites"]:
+        if favorite.get("picture_url"):
+            index.setdefault(favorite["picture_url"], favorite.get("id"))
+    return index
+
 class WallpaperFavorites:
     """Gestiona los fondos de pantalla favoritos."""
     
     # Fuente de wallpapers
     SOURCE_FAVORITE = "favorite"
     
+    # Cambios pendientes de escribir y temporizador que los agrupa
+    _dirty = False
+    _flush_timer = None
+    
     @staticmethod
     def get_favorites_file():
         """Obtiene la ruta del archivo con metadatos de favoritos."""
@@ -18,16 +39,84 @@ class WallpaperFavorites:
     
     @staticmethod
     def load_favorites_data():
-        """Carga los datos de favoritos desde el archivo JSON."""
+        """Carga los datos de favoritos, releyendo el JSON solo si el archivo cambió."""
         favorites_file = WallpaperFavorites.get_favorites_file()
-        favorites_data = read_json(favorites_file, {"favorites": []})
-        return favorites_data
+        try:
+            mtime = favorites_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        # Con cambios pendientes de guardar se conservan los datos en memoria
+        if (_cache["mtime"] != mtime and not WallpaperFavorites._dirty) or _cache["data"] is None:
+            _cache["data"] = read_json(favorites_file, {"favorites": []})
+            _cache["url_index"] = _build_url_index(_cache["data"])
+            _cache["mtime"] = mtime
+        return _cache["data"]
     
     @staticmethod
     def save_favorites_data(data):
         """Guarda los datos de favoritos en el archivo JSON."""
         favorites_file = WallpaperFavorites.get_favorites_file()
-        return write_json(favorites_file, data)
+        if not write_json(favorites_file, data):
+            # Fuerza una relectura para no quedarse con datos que no se guardaron
+            _cache["mtime"] = -1
+            return False
+        if data is not _cache["data"]:
+            _cache["data"] = data
+            _cache["url_index"] = _build_url_index(data)
+        try:
+            _cache["mtime"] = favorites_file.stat().st_mtime_ns
+        except OSError:
+            _cache["mtime"] = -1
+        return True
+    
+    @staticmethod
+    def flush():
+        """
+        Escribe los cambios pendientes de favoritos.
+        
+        Returns:
+            bool: True si no había cambios o se guardaron correctamente, False en caso contrario.
+        """
+        if not WallpaperFavorites._dirty or _cache["data"] is None:
+            return True
+        if not WallpaperFavorites.save_favorites_data(_cache["data"]):
+            return False
+        WallpaperFavorites._dirty = False
+        return True
+    
+    @staticmethod
+    def _commit_changes(favorites_data):
+        """
+        Registra una modificación y programa su escritura, de modo que varios
+        cambios seguidos se guardan juntos. Sin bucle de eventos de Qt en el
+        hilo actual se guarda en el momento.
+        """
+        _cache["data"] = favorites_data
+        WallpaperFavorites._dirty = True
+        app = QCoreApplication.instance()
+        if app is None or app.thread() is not QThread.currentThread():
+            return WallpaperFavorites.flush()
+        if WallpaperFavorites._flush_timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.setInterval(Constants.Files.FAVORITES_SAVE_DELAY)
+            timer.timeout.connect(WallpaperFavorites.flush)
+            WallpaperFavorites._flush_timer = timer
+        WallpaperFavorites._flush_timer.start()
+        return True
+    
+    @staticmethod
+    def _remove_from_url_index(favorite, favorites_data):
+        """Quita un favorito eliminado del índice por URL."""
+        picture_url = favorite.get("picture_url")
+        if _cache["url_index"].get(picture_url) != favorite.get("id"):
+            return
+        del _cache["url_index"][picture_url]
+        # Otro favorito con la misma URL pasa a ocupar la entrada
+        for other in favorites_data["favorites"]:
+            if other.get("picture_url") == picture_url:
+                _cache["url_index"][picture_url] = other.get("id")
+                break
     
     @staticmethod
     def add_to_favorites(wallpaper_info):
@@ -36,45 +125,53 @@ class WallpaperFavorites:
         
         Args:
             wallpaper_info: Diccionario con información del wallpaper.
-                Debe contener al menos 'picture_url', 'copyright' y el índice actual.
+                Debe contener al menos 'picture_url', 'copyright' y 'file_path' con
+                la ruta del archivo descargado.
             
         Returns:
             bool: True si se agregó correctamente, False en caso contrario.
         """
         try:
             # Obtener la ruta del wallpaper original
-            idx = wallpaper_info.get("current_index", 0)
-            source_file = Constants.get_wallpaper_file(idx)
+            file_path = wallpaper_info.get("file_path")
+            if not file_path:
+                log_error("El wallpaper no tiene un archivo asociado")
+                return False
+            source_file = Path(file_path)
             
             if not file_exists(source_file):
                 log_error(f"El archivo {source_file} no existe")
                 return False
             
-            # Generar un nombre único para el archivo favorito
-            timestamp = int(datetime.now().timestamp())
-            favorite_filename = f"favorite_{timestamp}{source_file.suffix}"
+            # Generar un nombre único para el archivo favorito; con nanosegundos
+            # varias altas seguidas no comparten ID ni archivo
+            now = datetime.now()
+            favorite_id = str(time.time_ns())
+            favorite_filename = f"favorite_{favorite_id}{source_file.suffix}"
             target_path = Constants.get_favorites_path() / favorite_filename
             
             # Copiar el archivo
-            if not copy_file(source_file, target_path):
+            if not copy_file(source_file, target_path, link=True):
                 return False
             
             # Crear registro de favorito con metadatos
             favorite_entry = {
-                "id": str(timestamp),
+                "id": favorite_id,
                 "picture_url": wallpaper_info.get("picture_url", ""),
                 "thumbnail_url": wallpaper_info.get("thumbnail_url", ""),
                 "copyright": wallpaper_info.get("copyright", "Sin título"),
-                "date": wallpaper_info.get("date", datetime.now().strftime("%Y-%m-%d")),
+                "date": wallpaper_info["date"] if "date" in wallpaper_info else now.strftime("%Y-%m-%d"),
                 "file_path": str(target_path),
-                "added_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "added_date": now.strftime("%Y-%m-%d %H:%M:%S"),
                 "source": WallpaperFavorites.SOURCE_FAVORITE  # Marca para identificar que es un favorito
             }
             
             # Añadir a la lista de favoritos
             favorites_data = WallpaperFavorites.load_favorites_data()
             favorites_data["favorites"].append(favorite_entry)
-            WallpaperFavorites.save_favorites_data(favorites_data)
+            if favorite_entry["picture_url"]:
+                _cache["url_index"].setdefault(favorite_entry["picture_url"], favorite_entry["id"])
+            WallpaperFavorites._commit_changes(favorites_data)
             
             log_info(f"Wallpaper agregado a favoritos: {favorite_entry['copyright']}")
             return True
@@ -106,7 +203,8 @@ class WallpaperFavorites:
                     
                     # Eliminar de la lista
                     favorites_data["favorites"].pop(i)
-                    WallpaperFavorites.save_favorites_data(favorites_data)
+                    WallpaperFavorites._remove_from_url_index(favorite, favorites_data)
+                    WallpaperFavorites._commit_changes(favorites_data)
                     log_info(f"Wallpaper eliminado de favoritos: {favorite.get('copyright', 'Sin título')}")
                     return True
             
@@ -135,14 +233,8 @@ class WallpaperFavorites:
             if not picture_url:
                 return None
                 
-            favorites_data = WallpaperFavorites.load_favorites_data()
-            
-            # Buscar por URL
-            for favorite in favorites_data["favorites"]:
-                if favorite.get("picture_url") == picture_url:
-                    return favorite.get("id")
-            
-            return None
+            WallpaperFavorites.load_favorites_data()
+            return _cache["url_index"].get(picture_url)
         except Exception as e:
             log_error(f"Error al verificar favorito: {str(e)}")
             return None
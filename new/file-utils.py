@@ -5,6 +5,11 @@ import shutil
 from pathlib import Path
 from utils.logger import log_error, log_info
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional; si no está se usa json estándar
+    orjson = None
+
 def ensure_directory(directory_path):
     """Asegura que un directorio exista, creándolo si es necesario."""
     try:
@@ -17,6 +22,8 @@ def ensure_directory(directory_path):
 def read_json(file_path, default=None):
     """Lee y parsea un archivo JSON con manejo de errores."""
     try:
+        if orjson is not None:
+            return orjson.loads(Path(file_path).read_bytes())
         with open(file_path, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -30,8 +37,15 @@ def read_json(file_path, default=None):
         return default if default is not None else {}
 
 def write_json(file_path, data, indent=4):
-    """Escribe datos en un archivo JSON con manejo de errores."""
+    """
+    Escribe datos en un archivo JSON con manejo de errores.
+    Con orjson cualquier indentación se escribe con 2 espacios.
+    """
     try:
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            Path(file_path).write_bytes(orjson.dumps(data, option=option))
+            return True
         with open(file_path, 'w') as f:
             json.dump(data, f, indent=indent)
         return True
@@ -39,9 +53,26 @@ def write_json(file_path, data, indent=4):
         log_error(f"Error al escribir archivo JSON {file_path}: {str(e)}")
         return False
 
-def copy_file(source, destination):
-    """Copia un archivo con manejo de errores."""
+def copy_file(source, destination, link=False):
+    """
+    Copia un archivo con manejo de errores. shutil.copy2 ya usa la copia del
+    sistema (sendfile en Linux, CopyFileEx en Windows).
+    
+    Args:
+        source: Ruta del archivo de origen
+        destination: Ruta de destino
+        link: Si es True se intenta crear un enlace duro en lugar de copiar los datos.
+            Solo es seguro si el origen nunca se modifica en el mismo archivo
+            (las descargas lo reemplazan con os.replace).
+    """
     try:
+        if link:
+            try:
+                os.link(source, destination)
+                return True
+            except OSError:
+                # Distinto sistema de archivos, destino existente o sin soporte
+                pass
         shutil.copy2(source, destination)
         return True
     except Exception as e:
@@ -60,3 +91,12 @@ def delete_file(file_path):
 def file_exists(file_path):
     """Comprueba si un archivo existe."""
     return Path(file_path).exists()
+
+def list_file_names(directory_path):
+    """Obtiene el conjunto de nombres de archivo de un directorio con una sola lectura."""
+    try:
+        with os.scandir(directory_path) as entries:
+            return {entry.name for entry in entries}
+    except Exception as e:
+        log_error(f"Error al listar directorio {directory_path}: {str(e)}")
+        return set()
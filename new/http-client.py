@@ -1,10 +1,69 @@
 # http_client.py
 import os
+import threading
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.logger import log_error, log_info
 
-def download_file(url, destination_path, chunk_size=8192, max_retries=3):
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx lo necesita para HTTP/2
+except ImportError:  # httpx[http2] es opcional; sin él las descargas usan requests (HTTP/1.1)
+    httpx = None
+
+# Sesión reutilizada por todas las descargas para aprovechar conexiones keep-alive
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Obtiene la sesión HTTP compartida, creándola con pool de conexiones y reintentos."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+# Cliente HTTP/2 compartido por las descargas de archivos cuando httpx está disponible
+_http2_client = None
+
+def _get_http2_client():
+    """Obtiene el cliente HTTP/2 compartido, que multiplexa las descargas concurrentes sobre una conexión."""
+    global _http2_client
+    if _http2_client is None:
+        with _session_lock:
+            if _http2_client is None:
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                    retries=3
+                )
+                _http2_client = httpx.Client(transport=transport, timeout=30, follow_redirects=True)
+    return _http2_client
+
+def _open_stream(url):
+    """Abre la respuesta en streaming de una URL, por HTTP/2 si httpx está disponible."""
+    if httpx is not None:
+        return _get_http2_client().stream("GET", url)
+    return get_session().get(url, stream=True, timeout=30)
+
+def _iter_chunks(response, chunk_size):
+    """Itera el cuerpo de una respuesta abierta con _open_stream."""
+    if httpx is not None:
+        return response.iter_bytes(chunk_size)
+    return response.iter_content(chunk_size=chunk_size)
+
+def download_file(url, destination_path, chunk_size=256 * 1024, max_retries=3):
     """
     Descarga un archivo desde una URL a una ruta local con validación y reintentos.
     
@@ -24,7 +83,7 @@ def download_file(url, destination_path, chunk_size=8192, max_retries=3):
     for attempt in range(max_retries):
         try:
             # Usar un archivo temporal para evitar archivos parciales
-            with requests.get(url, stream=True, timeout=30) as response:
+            with _open_stream(url) as response:
                 response.raise_for_status()
                 
                 # Verificar que el contenido es una imagen
@@ -33,15 +92,30 @@ def download_file(url, destination_path, chunk_size=8192, max_retries=3):
                     log_error(f"El contenido no es una imagen: {content_type} para URL {url}")
                     return False
                 
+                # Los marcadores JPEG solo se comprueban si el servidor envía un JPEG
+                check_jpeg = content_type.startswith(('image/jpeg', 'image/jpg', 'image/pjpeg'))
+                
                 # Obtener el tamaño esperado del archivo
                 expected_size = int(response.headers.get('Content-Length', 0))
                 log_info(f"Descargando {url} - Tamaño esperado: {expected_size} bytes")
                 
-                # Descargar a un archivo temporal
+                # Descargar a un archivo temporal, guardando los primeros y
+                # últimos bytes para verificar el JPEG sin volver a abrirlo
                 actual_size = 0
+                head = b''
+                tail = b''
                 with open(temp_file, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
+                    # Reservar el espacio de una vez cuando se conoce el tamaño
+                    if expected_size > 0:
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, expected_size)
+                        except (AttributeError, OSError):
+                            pass
+                    for chunk in _iter_chunks(response, chunk_size):
                         if chunk:  # filtrar keep-alive chunks
+                            if len(head) < 2:
+                                head = (head + chunk)[:2]
+                            tail = (tail + chunk[-2:])[-2:]
                             f.write(chunk)
                             actual_size += len(chunk)
             
@@ -55,8 +129,8 @@ def download_file(url, destination_path, chunk_size=8192, max_retries=3):
             
             # Si todo está correcto, mover el archivo temporal al destino final
             if temp_file.exists():
-                # Verificar integridad básica de imagen JPEG
-                if verify_jpeg_integrity(temp_file):
+                # Verificar integridad básica de imagen JPEG: SOI (FF D8) y EOI (FF D9)
+                if not check_jpeg or (head == b'\xFF\xD8' and tail == b'\xFF\xD9'):
                     # Renombrar al destino final
                     if destination_path.exists():
                         os.remove(destination_path)
@@ -92,7 +166,9 @@ def download_file(url, destination_path, chunk_size=8192, max_retries=3):
 
 def verify_jpeg_integrity(file_path):
     """
-    Verifica que un archivo sea un JPEG válido comprobando sus marcadores.
+    Verifica que un archivo ya guardado sea un JPEG válido comprobando sus
+    marcadores. Las descargas lo comprueban durante el streaming; esta función
+    queda para revalidar archivos existentes.
     
     Args:
         file_path: Ruta al archivo a verificar
@@ -126,8 +202,10 @@ def download_content(url):
         Response o None: Objeto de respuesta si la descarga fue exitosa, None en caso contrario
     """
     try:
-        response = requests.get(url, timeout=30)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
+        # Bing responde en UTF-8; se evita la detección de codificación al leer response.text
+        response.encoding = "utf-8"
         return response
     except Exception as e:
         log_error(f"Error al descargar contenido de {url}: {str(e)}")
@@ -144,7 +222,7 @@ def download_binary(url):
         bytes o None: Contenido binario si la descarga fue exitosa, None en caso contrario
     """
     try:
-        response = requests.get(url, timeout=30)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         return response.content
     except Exception as e:
@@ -1,10 +1,24 @@
 # resource_utils.py
 import os
 import subprocess
-import platform
+import sys
 from pathlib import Path
 from utils.logger import log_error
 
+def _run_opener(command, target):
+    """Abre un recurso con la orden del sistema indicada."""
+    subprocess.run([command, str(target)], check=True)
+
+# Método de apertura de la plataforma, resuelto una sola vez al importar el módulo
+if sys.platform == 'win32':
+    _open_native = os.startfile
+elif sys.platform == 'darwin':  # macOS
+    def _open_native(target):
+        _run_opener('open', target)
+else:  # Linux y otros
+    def _open_native(target):
+        _run_opener('xdg-open', target)
+
 def open_url(url):
     """
     Abre una URL en el navegador web predeterminado.
@@ -16,15 +30,7 @@ def open_url(url):
         bool: True si fue exitoso, False en caso contrario
     """
     try:
-        # Diferentes métodos según la plataforma
-        system = platform.system()
-        
-        if system == 'Windows':
-            os.startfile(url)
-        elif system == 'Darwin':  # macOS
-            subprocess.run(['open', url], check=True)
-        else:  # Linux y otros
-            subprocess.run(['xdg-open', url], check=True)
+        _open_native(url)
         return True
     except Exception as e:
         log_error(f"Error al abrir URL {url}: {str(e)}")
@@ -44,16 +50,8 @@ def open_folder(folder_path):
         folder_path = Path(folder_path)
         if not folder_path.exists():
             return False
-            
-        # Diferentes métodos según la plataforma
-        system = platform.system()
         
-        if system == 'Windows':
-            os.startfile(folder_path)
-        elif system == 'Darwin':  # macOS
-            subprocess.run(['open', folder_path], check=True)
-        else:  # Linux y otros
-            subprocess.run(['xdg-open', folder_path], check=True)
+        _open_native(folder_path)
         return True
     except Exception as e:
         log_error(f"Error al abrir carpeta {folder_path}: {str(e)}")
@@ -8,26 +8,87 @@ Al finalizar, abre automáticamente la carpeta de favoritos.
 """
 
 import argparse
+import asyncio
+import functools
 import logging
-import time
 import json
-import requests
+import mmap
+import re
 from pathlib import Path
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from constants import Constants
-from core.wallpaper_favorites import add_favorite_by_date, WallpaperFavorites
+from core.wallpaper_favorites import WallpaperFavorites
+from utils.file_utils import list_file_names
+from utils.http_client import get_session
 from utils.resource_utils import open_folder
-from utils.wallpaper_utils import build_wallpaper_info_by_date
-from rich.console import Console
+from utils.wallpaper_utils import (build_wallpaper_info_by_date, reformat_date, construct_picture_url,
+                                   ensure_wallpaper_downloaded, ensure_thumbnail_downloaded)
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.rule import Rule
 from rich.text import Text
 from rich.table import Table
 from rich.logging import RichHandler
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson es opcional; si no está se usa json estándar
+    _loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # ijson es opcional; sin él el archivo se parsea completo en memoria
+    ijson = None
+
 # Configuración de consola Rich para salida formateada
 console = Console()
 
+# Número máximo de wallpapers descargándose a la vez
+MAX_CONCURRENT_DOWNLOADS = 5
+
+# Líneas "YYYYMMDD.jpg" de la lista (la fecha es el nombre sin extensión) y líneas no vacías
+_JPG_LINE_RX = re.compile(rb'^[ \t\r]*(.+?)\.jpg[ \t\r]*$', re.IGNORECASE | re.MULTILINE)
+_NON_EMPTY_LINE_RX = re.compile(rb'^[ \t\r]*\S', re.MULTILINE)
+
+# Columnas (nombre, estilo) de la tabla de metadata de cada wallpaper
+_METADATA_COLUMNS = (("Clave", "yellow"), ("Valor", None))
+
+def _new_metadata_table():
+    """Crea una tabla vacía de metadata con las columnas ya configuradas."""
+    table = Table(box=None, show_header=False, pad_edge=False)
+    for name, style in _METADATA_COLUMNS:
+        table.add_column(name, style=style)
+    return table
+
+@functools.lru_cache(maxsize=1)
+def _load_archive_index():
+    """
+    Descarga y parsea una sola vez el archivo JSON del servicio, indexándolo por fecha.
+    Si la descarga falla se lanza la excepción, de modo que el fallo no queda en caché.
+    
+    Returns:
+        dict: Diccionario {fecha: metadata} con las imágenes del archivo
+    """
+    url = Constants.get_archive_url()
+    # La sesión compartida con las descargas reutiliza la conexión TLS con Bing
+    if ijson is not None:
+        # Parseo incremental: el cuerpo nunca se guarda completo en memoria
+        with get_session().get(url, timeout=(3.05, 10), stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return {
+                image_data.get("date"): image_data
+                for image_data in ijson.items(response.raw, "item", use_float=True)
+            }
+    
+    response = get_session().get(url, timeout=(3.05, 10))
+    response.raise_for_status()
+    return {image_data.get("date"): image_data for image_data in _loads(response.content)}
+
 def get_wallpaper_metadata(date_str):
     """
     Obtiene la metadata completa del wallpaper para una fecha específica.
@@ -43,36 +104,31 @@ def get_wallpaper_metadata(date_str):
         formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
     
     try:
-        # Intentar obtener los metadatos desde el archivo JSON del servicio
-        url = Constants.get_archive_url()
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Buscar la imagen correspondiente a la fecha
-            for image_data in data:
-                if image_data.get("date") == formatted_date:
-                    return image_data
+        # Buscar la imagen correspondiente a la fecha en el índice del archivo JSON
+        metadata = _load_archive_index().get(formatted_date)
+        if metadata is not None:
+            return metadata
         
         return {"date": formatted_date, "title": "Sin título disponible", "description": "Sin descripción disponible"}
     except Exception as e:
         logging.error(f"Error al obtener metadata de wallpaper {date_str}: {str(e)}")
         return {"date": formatted_date, "error": str(e)}
 
-def display_metadata(metadata, date_str, index, total):
+def build_metadata_panel(metadata, date_str, index, total):
     """
-    Muestra la metadata del wallpaper en un formato estructurado y visualmente agradable.
+    Construye el panel con la metadata del wallpaper en un formato estructurado y visualmente agradable.
     
     Args:
         metadata: Diccionario con la metadata del wallpaper
         date_str: Fecha del wallpaper en formato YYYYMMDD
         index: Índice actual en el proceso
         total: Total de wallpapers a procesar
+    
+    Returns:
+        Panel: Panel de Rich listo para imprimir
     """
     # Crear una tabla para la metadata
-    metadata_table = Table(box=None, show_header=False, pad_edge=False)
-    metadata_table.add_column("Clave", style="yellow")
-    metadata_table.add_column("Valor")
+    metadata_table = _new_metadata_table()
     
     # Ordenar las claves para una presentación consistente
     for key in sorted(metadata.keys()):
@@ -97,7 +153,7 @@ def display_metadata(metadata, date_str, index, total):
     content.append("🔵 METADATA:\n", style="bold blue")
     
     # Crear un panel con toda la información
-    panel = Panel(
+    return Panel(
         Group(
             content,
             metadata_table
@@ -106,41 +162,90 @@ def display_metadata(metadata, date_str, index, total):
         border_style="cyan",
         expand=False
     )
-    
-    console.print(panel)
 
-def add_wallpaper_favorite(date_str, index, total):
+def add_wallpaper_favorite(date_str, index, total, pending):
     """
-    Agrega un wallpaper a favoritos y muestra su metadata estructurada
+    Prepara un wallpaper para agregarlo a favoritos y muestra su metadata estructurada.
+    El alta se hace al final en bloque, para escribir el archivo de favoritos una sola vez.
+    Toda la salida del wallpaper se compone en un solo grupo y se imprime de una vez.
     
     Args:
         date_str: La fecha en formato YYYYMMDD
         index: Índice actual en el proceso
         total: Total de wallpapers a procesar
+        pending: Diccionario {picture_url: (date_str, wallpaper_info)} con las altas pendientes
     
     Returns:
-        bool: True si se agregó correctamente, False en caso contrario
+        bool: True si se preparó correctamente o ya era favorito, False en caso contrario
     """
-    console.print(f"[cyan]Procesando wallpaper[/cyan] [bold white]{index}/{total}[/bold white]: {date_str}")
+    renderables = [
+        Rule(f"Progreso: {index}/{total} ({index/total*100:.1f}%)"),
+        Text.from_markup(f"[cyan]Procesando wallpaper[/cyan] [bold white]{index}/{total}[/bold white]: {date_str}")
+    ]
     
     try:
         # Obtener la metadata completa
         metadata = get_wallpaper_metadata(date_str)
         
-        # Intentar agregar a favoritos
-        result = add_favorite_by_date(date_str)
+        # Construir la información del wallpaper (los archivos ya están descargados)
+        wallpaper_info = build_wallpaper_info_by_date(date_str)
+        if wallpaper_info is None:
+            renderables.append(Text.from_markup(f"[red]❌ Error al agregar wallpaper {date_str} a favoritos.[/red]"))
+            return False
         
-        if result:
-            console.print(f"[green]✅ Wallpaper {date_str} agregado a favoritos correctamente.[/green]")
-            # Mostrar la metadata estructurada
-            display_metadata(metadata, date_str, index, total)
+        picture_url = wallpaper_info.get("picture_url", "")
+        if picture_url in pending or WallpaperFavorites.is_favorite(wallpaper_info):
+            renderables.append(Text.from_markup(f"[green]✅ Wallpaper {date_str} ya está en favoritos.[/green]"))
         else:
-            console.print(f"[red]❌ Error al agregar wallpaper {date_str} a favoritos.[/red]")
+            pending[picture_url] = (date_str, wallpaper_info)
+            renderables.append(Text.from_markup(f"[green]✅ Wallpaper {date_str} listo para agregar a favoritos.[/green]"))
         
-        return result
+        # Mostrar la metadata estructurada
+        renderables.append(build_metadata_panel(metadata, date_str, index, total))
+        return True
     except Exception as e:
-        console.print(f"[red]❌ Excepción al procesar {date_str}: {str(e)}[/red]")
+        renderables.append(Text.from_markup(f"[red]❌ Excepción al procesar {date_str}: {str(e)}[/red]"))
         return False
+    finally:
+        renderables.append(Text())
+        console.print(Group(*renderables))
+
+def _download_date(date_str, existing, delay_seconds):
+    """
+    Descarga el wallpaper y la miniatura de una fecha si aún no están en disco.
+    
+    Args:
+        date_str: Fecha en formato YYYYMMDD
+        existing: Conjunto con los nombres de archivo ya presentes en el directorio de wallpapers
+        delay_seconds: Retraso tras la descarga para evitar sobrecargar el servidor
+    """
+    formatted_date = reformat_date(date_str)
+    file_date = formatted_date.replace("-", "")
+    missing = f"{file_date}.jpg" not in existing or f"{file_date}_thumb.jpg" not in existing
+    ensure_wallpaper_downloaded(formatted_date, existing)
+    ensure_thumbnail_downloaded(formatted_date, existing)
+    if missing and delay_seconds > 0:
+        time.sleep(delay_seconds)
+
+async def _download_all(dates, delay_seconds):
+    """
+    Descarga en paralelo los archivos de todas las fechas y el índice de metadata.
+    
+    Args:
+        dates: Lista de fechas en formato YYYYMMDD
+        delay_seconds: Retraso entre descargas para evitar sobrecargar el servidor
+    """
+    # Una sola lectura del directorio en lugar de un stat por archivo
+    existing = list_file_names(Constants.get_wallpapers_path())
+    
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as pool:
+        await asyncio.gather(
+            asyncio.to_thread(get_wallpaper_metadata, dates[0]),
+            *(loop.run_in_executor(pool, _download_date, date_str, existing,
+                                   delay_seconds / MAX_CONCURRENT_DOWNLOADS)
+              for date_str in dates)
+        )
 
 def process_favorites_file(file_path: Path, delay_seconds: float = 1.0):
     """
@@ -154,46 +259,64 @@ def process_favorites_file(file_path: Path, delay_seconds: float = 1.0):
         console.print(f"[red]El archivo {file_path} no existe.[/red]")
         return
 
-    with file_path.open("r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Filtrar líneas vacías y extraer fechas de los nombres de archivo
+    # Extraer las fechas de los nombres de archivo con una sola pasada de la regex
     wallpapers_to_process = []
-    for line in lines:
-        filename = line.strip()
-        if not filename:
-            continue
-        if not filename.lower().endswith(".jpg"):
-            console.print(f"[yellow]El archivo '{filename}' no tiene extensión .jpg. Se omitirá.[/yellow]")
-            continue
-            
-        date_str = filename[:-4]  # Se asume formato "YYYYMMDD.jpg"
-        wallpapers_to_process.append(date_str)
+    skipped = 0
+    if file_path.stat().st_size > 0:
+        with file_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            wallpapers_to_process = [m.group(1).decode("utf-8") for m in _JPG_LINE_RX.finditer(mm)]
+            skipped = sum(1 for _ in _NON_EMPTY_LINE_RX.finditer(mm)) - len(wallpapers_to_process)
+    
+    if skipped > 0:
+        console.print(f"[yellow]Se omitirán {skipped} líneas sin extensión .jpg.[/yellow]")
+    
+    # Las fechas que ya están en favoritos se descartan sin tocar la red
+    favorite_urls = {favorite.get("picture_url") for favorite in WallpaperFavorites.get_favorites_list()}
+    remaining = [
+        date_str for date_str in wallpapers_to_process
+        if construct_picture_url(reformat_date(date_str)) not in favorite_urls
+    ]
+    already_count = len(wallpapers_to_process) - len(remaining)
+    wallpapers_to_process = remaining
+    if already_count > 0:
+        console.print(f"[green]✅ {already_count} wallpapers ya están en favoritos. Se omitirán.[/green]")
     
     total = len(wallpapers_to_process)
     console.print(f"[bold cyan]📋 Procesando {total} wallpapers...[/bold cyan]")
     console.print()
     
-    success_count = 0
+    success_count = already_count
     error_count = 0
     
+    # Las descargas se hacen en paralelo; después los favoritos se preparan en
+    # orden y se agregan todos juntos al final
+    if wallpapers_to_process:
+        console.print(f"[cyan]⬇️  Descargando wallpapers ({MAX_CONCURRENT_DOWNLOADS} a la vez)...[/cyan]")
+        asyncio.run(_download_all(wallpapers_to_process, delay_seconds))
+        console.print()
+    
     # Procesamiento secuencial con presentación estructurada
+    pending = {}
     for i, date_str in enumerate(wallpapers_to_process, 1):
-        console.rule(f"Progreso: {i}/{total} ({i/total*100:.1f}%)")
-        
-        if add_wallpaper_favorite(date_str, i, total):
+        if add_wallpaper_favorite(date_str, i, total, pending):
             success_count += 1
         else:
             error_count += 1
-        
-        console.print()
-        
-        if delay_seconds > 0 and i < total:
-            time.sleep(delay_seconds)  # Evitar sobrecargar el servidor
+    
+    # Alta de todos los favoritos pendientes con una sola escritura del archivo
+    if pending:
+        entries = list(pending.values())
+        results = WallpaperFavorites.add_many([wallpaper_info for _, wallpaper_info in entries])
+        for (date_str, _), added in zip(entries, results):
+            if not added:
+                console.print(f"[red]❌ Error al agregar wallpaper {date_str} a favoritos.[/red]")
+                success_count -= 1
+                error_count += 1
+        console.print(f"[green]💾 {sum(results)} wallpapers agregados a favoritos.[/green]")
     
     # Resumen final
     console.rule("[bold green]Proceso Completado[/bold green]")
-    console.print(f"[bold]✨ Proceso completado:[/bold] [green]{success_count} exitosos[/green], [red]{error_count} fallidos[/red] de [cyan]{total} total[/cyan].")
+    console.print(f"[bold]✨ Proceso completado:[/bold] [green]{success_count} exitosos[/green], [red]{error_count} fallidos[/red] de [cyan]{total + already_count} total[/cyan].")
     
     # Mostrar sugerencia de verificación visual
     if error_count > 0:
@@ -230,9 +353,6 @@ def main():
             console.print("[red]❌ No se pudo abrir la carpeta de favoritos automáticamente.[/red]")
 
 if __name__ == "__main__":
-    # Importar Group aquí para evitar problemas de dependencias circulares
-    from rich.console import Group
-    
     try:
         main()
     except KeyboardInterrupt:
@@ -1,4 +1,5 @@
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from constants import Constants
@@ -12,6 +13,10 @@ class WallpaperFavorites:
     # Fuente de wallpapers
     SOURCE_FAVORITE = "favorite"
     
+    # Índice {picture_url: id} y fecha de modificación del archivo con la que se construyó
+    _index_cache = None
+    _index_mtime = None
+    
     @staticmethod
     def get_favorites_file():
         """Obtiene la ruta del archivo con metadatos de favoritos."""
@@ -28,8 +33,81 @@ class WallpaperFavorites:
     def save_favorites_data(data):
         """Guarda los datos de favoritos en el archivo JSON."""
         favorites_file = WallpaperFavorites.get_favorites_file()
+        WallpaperFavorites._index_cache = None
         return write_json(favorites_file, data)
     
+    @staticmethod
+    def _get_index():
+        """
+        Obtiene el índice {picture_url: id} de los favoritos, reconstruyéndolo
+        solo si el archivo de favoritos cambió desde la última consulta.
+        
+        Returns:
+            dict: Diccionario con el ID de favorito de cada URL de imagen.
+        """
+        try:
+            mtime = WallpaperFavorites.get_favorites_file().stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        if WallpaperFavorites._index_cache is None or WallpaperFavorites._index_mtime != mtime:
+            index = {}
+            for favorite in WallpaperFavorites.load_favorites_data()["favorites"]:
+                picture_url = favorite.get("picture_url")
+                # Con URLs repetidas se conserva el primer favorito, como en la búsqueda lineal
+                if picture_url and picture_url not in index:
+                    index[picture_url] = favorite.get("id")
+            WallpaperFavorites._index_cache = index
+            WallpaperFavorites._index_mtime = mtime
+        return WallpaperFavorites._index_cache
+    
+    @staticmethod
+    def _create_favorite_entry(wallpaper_info, taken_ids):
+        """
+        Copia el archivo del wallpaper a la carpeta de favoritos y construye su registro.
+        Se utiliza el campo "file_path" de wallpaper_info, si existe, para obtener
+        la ruta del archivo descargado.
+        
+        Args:
+            wallpaper_info: Diccionario con información del wallpaper.
+            taken_ids: Conjunto de IDs ya usados; el ID nuevo se agrega al conjunto.
+            
+        Returns:
+            dict or None: Registro del favorito, o None si no se pudo copiar el archivo.
+        """
+        source_file_path = wallpaper_info.get("file_path")
+        if source_file_path:
+            source_file = Path(source_file_path)
+        else:
+            idx = wallpaper_info.get("current_index", 0)
+            source_file = Constants.get_wallpaper_file(idx)
+        
+        if not file_exists(source_file):
+            log_error(f"El archivo {source_file} no existe")
+            return None
+        
+        # Varias altas seguidas no deben compartir ID ni archivo
+        now = datetime.now()
+        timestamp = time.time_ns()
+        while str(timestamp) in taken_ids:
+            timestamp += 1
+        favorite_filename = f"favorite_{timestamp}{source_file.suffix}"
+        target_path = Constants.get_favorites_path() / favorite_filename
+        
+        if not copy_file(source_file, target_path, link=True):
+            return None
+        taken_ids.add(str(timestamp))
+        
+        return {
+            "id": str(timestamp),
+            "picture_url": wallpaper_info.get("picture_url", ""),
+            "thumbnail_url": wallpaper_info.get("thumbnail_url", ""),
+            "copyright": wallpaper_info.get("copyright", "Sin título"),
+            "date": wallpaper_info["date"] if "date" in wallpaper_info else now.strftime("%Y-%m-%d"),
+            "file_path": str(target_path),
+            "added_date": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "source": WallpaperFavorites.SOURCE_FAVORITE
+        }
+    
     @staticmethod
     def add_to_favorites(wallpaper_info):
         """
@@ -37,45 +115,45 @@ class WallpaperFavorites:
         Se utiliza el campo "file_path" de wallpaper_info, si existe, para obtener
         la ruta del archivo descargado.
         """
-        try:
-            source_file_path = wallpaper_info.get("file_path")
-            if source_file_path:
-                source_file = Path(source_file_path)
-            else:
-                idx = wallpaper_info.get("current_index", 0)
-                source_file = Constants.get_wallpaper_file(idx)
-            
-            if not file_exists(source_file):
-                log_error(f"El archivo {source_file} no existe")
-                return False
-            
-            timestamp = int(datetime.now().timestamp())
-            favorite_filename = f"favorite_{timestamp}{source_file.suffix}"
-            target_path = Constants.get_favorites_path() / favorite_filename
-            
-            if not copy_file(source_file, target_path):
-                return False
-            
-            favorite_entry = {
-                "id": str(timestamp),
-                "picture_url": wallpaper_info.get("picture_url", ""),
-                "thumbnail_url": wallpaper_info.get("thumbnail_url", ""),
-                "copyright": wallpaper_info.get("copyright", "Sin título"),
-                "date": wallpaper_info.get("date", datetime.now().strftime("%Y-%m-%d")),
-                "file_path": str(target_path),
-                "added_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "source": WallpaperFavorites.SOURCE_FAVORITE
-            }
+        return WallpaperFavorites.add_many([wallpaper_info])[0]
+    
+    @staticmethod
+    def add_many(wallpaper_infos):
+        """
+        Agrega varios wallpapers a favoritos leyendo y escribiendo el archivo
+        de favoritos una sola vez.
+        
+        Args:
+            wallpaper_infos: Lista de diccionarios con información de los wallpapers.
             
+        Returns:
+            list: Lista de bool con el resultado de cada alta, en el mismo orden.
+        """
+        results = []
+        try:
             favorites_data = WallpaperFavorites.load_favorites_data()
-            favorites_data["favorites"].append(favorite_entry)
-            WallpaperFavorites.save_favorites_data(favorites_data)
+            taken_ids = {favorite.get("id") for favorite in favorites_data["favorites"]}
+            
+            added = []
+            for wallpaper_info in wallpaper_infos:
+                try:
+                    favorite_entry = WallpaperFavorites._create_favorite_entry(wallpaper_info, taken_ids)
+                except Exception as e:
+                    log_error(f"Error al agregar a favoritos: {str(e)}")
+                    favorite_entry = None
+                results.append(favorite_entry is not None)
+                if favorite_entry is not None:
+                    added.append(favorite_entry)
             
-            log_info(f"Wallpaper agregado a favoritos: {favorite_entry.get('copyright')}")
-            return True
+            if added:
+                favorites_data["favorites"].extend(added)
+                WallpaperFavorites.save_favorites_data(favorites_data)
+                for favorite_entry in added:
+                    log_info(f"Wallpaper agregado a favoritos: {favorite_entry.get('copyright')}")
+            return results
         except Exception as e:
             log_error(f"Error al agregar a favoritos: {str(e)}")
-            return False
+            return results + [False] * (len(wallpaper_infos) - len(results))
     
     @staticmethod
     def remove_from_favorites(favorite_id):
@@ -122,11 +200,7 @@ class WallpaperFavorites:
             picture_url = wallpaper_info.get("picture_url", "")
             if not picture_url:
                 return None
-            favorites_data = WallpaperFavorites.load_favorites_data()
-            for favorite in favorites_data["favorites"]:
-                if favorite.get("picture_url") == picture_url:
-                    return favorite.get("id")
-            return None
+            return WallpaperFavorites._get_index().get(picture_url)
         except Exception as e:
             log_error(f"Error al verificar favorito: {str(e)}")
             return None
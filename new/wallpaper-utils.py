@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Set
 
 from constants import Constants
 from utils.http_client import download_file
@@ -16,6 +17,7 @@ def reformat_date(date_str: str) -> str:
         return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
     return date_str
 
+@lru_cache(maxsize=1024)
 def construct_picture_url(date_str: str) -> str:
     """
     Construye la URL del wallpaper en alta resolución usando el date_str.
@@ -26,6 +28,7 @@ def construct_picture_url(date_str: str) -> str:
         Constants.BING_ARCHIVE_COUNTRY, Constants.BING_ARCHIVE_LANGUAGE, formatted_date
     )
 
+@lru_cache(maxsize=1024)
 def construct_thumbnail_url(date_str: str) -> str:
     """
     Construye la URL de la miniatura usando el date_str.
@@ -36,7 +39,8 @@ def construct_thumbnail_url(date_str: str) -> str:
         Constants.BING_ARCHIVE_COUNTRY, Constants.BING_ARCHIVE_LANGUAGE, formatted_date
     )
 
-def _ensure_file_downloaded(date_str: str, file_suffix: str, url_constructor: Callable[[str], str]) -> Optional[Path]:
+def _ensure_file_downloaded(date_str: str, file_suffix: str, url_constructor: Callable[[str], str],
+                            existing: Optional[Set[str]] = None) -> Optional[Path]:
     """
     Función genérica para asegurar que un archivo (wallpaper o miniatura) esté descargado.
 
@@ -44,6 +48,8 @@ def _ensure_file_downloaded(date_str: str, file_suffix: str, url_constructor: Ca
         date_str: La fecha en formato 'YYYYMMDD' o 'YYYY-MM-DD'.
         file_suffix: Sufijo para el nombre del archivo (por ejemplo, ".jpg" o "_thumb.jpg").
         url_constructor: Función que, a partir de date_str, construye la URL correspondiente.
+        existing: Conjunto opcional con los nombres de archivo ya presentes en el
+            directorio de wallpapers; si se indica, evita un stat por archivo.
 
     Returns:
         El Path del archivo descargado o existente; o None si falla la descarga.
@@ -51,9 +57,11 @@ def _ensure_file_downloaded(date_str: str, file_suffix: str, url_constructor: Ca
     # Usamos la fecha sin guiones para el nombre del archivo
     file_date = date_str.replace("-", "")
     wallpapers_dir: Path = Constants.get_wallpapers_path()
-    local_file: Path = wallpapers_dir / f"{file_date}{file_suffix}"
+    file_name = f"{file_date}{file_suffix}"
+    local_file: Path = wallpapers_dir / file_name
     
-    if not file_exists(local_file):
+    is_present = file_name in existing if existing is not None else file_exists(local_file)
+    if not is_present:
         url = url_constructor(date_str)
         if file_suffix.startswith("_thumb"):
             log_info(f"Descargando miniatura {date_str} desde {url}...")
@@ -75,23 +83,23 @@ def _ensure_file_downloaded(date_str: str, file_suffix: str, url_constructor: Ca
             log_info(f"Wallpaper {date_str} ya existe.")
     return local_file
 
-def ensure_wallpaper_downloaded(date_str: str) -> Optional[Path]:
+def ensure_wallpaper_downloaded(date_str: str, existing: Optional[Set[str]] = None) -> Optional[Path]:
     """
     Asegura que el wallpaper identificado por date_str esté descargado.
     
     Returns:
         El Path del wallpaper o None si falla la descarga.
     """
-    return _ensure_file_downloaded(date_str, ".jpg", construct_picture_url)
+    return _ensure_file_downloaded(date_str, ".jpg", construct_picture_url, existing)
 
-def ensure_thumbnail_downloaded(date_str: str) -> Optional[Path]:
+def ensure_thumbnail_downloaded(date_str: str, existing: Optional[Set[str]] = None) -> Optional[Path]:
     """
     Asegura que la miniatura del wallpaper identificado por date_str esté descargado.
     
     Returns:
         El Path de la miniatura o None si falla la descarga.
     """
-    return _ensure_file_downloaded(date_str, "_thumb.jpg", construct_thumbnail_url)
+    return _ensure_file_downloaded(date_str, "_thumb.jpg", construct_thumbnail_url, existing)
 
 def build_wallpaper_info_by_date(date_str: str) -> Optional[dict]:
     """
@@ -101,16 +109,19 @@ def build_wallpaper_info_by_date(date_str: str) -> Optional[dict]:
     Returns:
         Diccionario con los datos del wallpaper o None si falla la descarga.
     """
-    local_file = ensure_wallpaper_downloaded(date_str)
+    # La fecha se normaliza una sola vez y se reutiliza en todas las llamadas
+    formatted_date = reformat_date(date_str)
+    
+    local_file = ensure_wallpaper_downloaded(formatted_date)
     if local_file is None:
         return None
     
     # Intentar descargar la miniatura; su ausencia no impide la construcción de la info.
-    ensure_thumbnail_downloaded(date_str)
+    ensure_thumbnail_downloaded(formatted_date)
     
     wallpaper_info = {
-        "picture_url": construct_picture_url(date_str),
-        "thumbnail_url": construct_thumbnail_url(date_str),
+        "picture_url": construct_picture_url(formatted_date),
+        "thumbnail_url": construct_thumbnail_url(formatted_date),
         "copyright": f"Wallpaper {date_str}",
         "date": date_str,
         "file_path": str(local_file),
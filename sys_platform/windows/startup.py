@@ -4,32 +4,38 @@ import winreg
 from constants import Constants
 from utils.logger import log_error
 
+# Comando de inicio: sys.executable es la ruta del intérprete de Python y
+# sys.argv[0] la del script actual; ninguno cambia durante la ejecución
+_STARTUP_COMMAND = f'"{sys.executable}" "{os.path.abspath(sys.argv[0])}" /background'
+
 class StartupManager:
     """Gestiona la configuración de inicio con Windows."""
     
+    # Último estado leído o escrito en el registro
+    _run_on_startup = None
+    
     @staticmethod
     def get_run_on_startup():
         """Comprueba si la aplicación está configurada para iniciarse con Windows."""
+        if StartupManager._run_on_startup is not None:
+            return StartupManager._run_on_startup
+        
         try:
             # Abre la clave del registro
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 Constants.Windows.REGISTRY_RUN_PATH,
                 0, winreg.KEY_READ
-            )
+            ) as key:
+                # Intenta leer el valor
+                try:
+                    value, _ = winreg.QueryValueEx(key, Constants.APP_NAME)
+                except OSError:
+                    value = None
             
-            # Intenta leer el valor
-            try:
-                value, _ = winreg.QueryValueEx(key, Constants.APP_NAME)
-                winreg.CloseKey(key)
-                
-                # Verifica que el comando coincida con el comando esperado
-                expected_cmd = f'"{sys.executable}" "{os.path.abspath(sys.argv[0])}" /background'
-                return value == expected_cmd
-            except Exception:
-                winreg.CloseKey(key)
-                return False
-                
+            # Verifica que el comando coincida con el comando esperado
+            StartupManager._run_on_startup = value == _STARTUP_COMMAND
+            return StartupManager._run_on_startup
         except Exception as e:
             log_error(f"Error al verificar inicio automático: {str(e)}")
             return False
@@ -37,28 +43,30 @@ class StartupManager:
     @staticmethod
     def set_run_on_startup(enable):
         """Configura si la aplicación debe iniciarse con Windows."""
+        # No se escribe en el registro si el estado pedido ya es el actual
+        if bool(enable) == StartupManager.get_run_on_startup():
+            return True
+        
+        # El estado se vuelve a leer del registro en la próxima consulta si algo falla
+        StartupManager._run_on_startup = None
         try:
             # Abre la clave del registro con permisos de escritura
-            key = winreg.OpenKey(
+            with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
                 Constants.Windows.REGISTRY_RUN_PATH,
                 0, winreg.KEY_WRITE
-            )
+            ) as key:
+                if enable:
+                    # Define el comando para ejecutar al inicio
+                    winreg.SetValueEx(key, Constants.APP_NAME, 0, winreg.REG_SZ, _STARTUP_COMMAND)
+                else:
+                    # Elimina la entrada del registro
+                    try:
+                        winreg.DeleteValue(key, Constants.APP_NAME)
+                    except Exception:
+                        pass  # Si no existe, simplemente ignoramos el error
             
-            if enable:
-                # Define el comando para ejecutar al inicio
-                # Usa sys.executable para obtener la ruta del intérprete de Python
-                # y sys.argv[0] para obtener la ruta del script actual
-                cmd = f'"{sys.executable}" "{os.path.abspath(sys.argv[0])}" /background'
-                winreg.SetValueEx(key, Constants.APP_NAME, 0, winreg.REG_SZ, cmd)
-            else:
-                # Elimina la entrada del registro
-                try:
-                    winreg.DeleteValue(key, Constants.APP_NAME)
-                except Exception:
-                    pass  # Si no existe, simplemente ignoramos el error
-                    
-            winreg.CloseKey(key)
+            StartupManager._run_on_startup = bool(enable)
             return True
         except Exception as e:
             log_error(f"Error al configurar el inicio automático: {str(e)}")
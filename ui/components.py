@@ -1,4 +1,5 @@
 # ui_components.py
+from functools import lru_cache
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon, QPixmap, QFont
 from PyQt5.QtWidgets import (QLabel, QPushButton, QCheckBox, 
@@ -9,11 +10,9 @@ def apply_zoom(size, zoom_factor):
     """Aplica factor de zoom a un valor de tamaño."""
     return int(size * zoom_factor)
 
-def create_label(text, font_size, bold=False, color=None, zoom_factor=1.0):
-    """Crea un QLabel con estilo."""
-    label = QLabel(text)
-    
-    # Aplicar estilo
+@lru_cache(maxsize=128)
+def label_stylesheet(font_size, bold=False, color=None, zoom_factor=1.0):
+    """Construye la hoja de estilo de un QLabel; el resultado se reutiliza entre llamadas."""
     style = []
     
     # Tamaño de fuente con zoom
@@ -28,19 +27,27 @@ def create_label(text, font_size, bold=False, color=None, zoom_factor=1.0):
     if color:
         style.append(f"color: {color}")
     
+    return "; ".join(style)
+
+def create_label(text, font_size, bold=False, color=None, zoom_factor=1.0):
+    """Crea un QLabel con estilo."""
+    label = QLabel(text)
+    
     # Aplicar estilo
-    label.setStyleSheet("; ".join(style))
+    label.setStyleSheet(label_stylesheet(font_size, bold, color, zoom_factor))
     
     return label
 
-def create_button(text, font_size=None, icon=None, background=None, 
-                 color="white", padding=None, border_radius=None, 
-                 zoom_factor=1.0, hover_color=None):
-    """Crea un QPushButton con estilo."""
-    button = QPushButton(text)
-    
+@lru_cache(maxsize=128)
+def button_stylesheet(font_size=None, background=None, color="white", padding=None,
+                      border_radius=None, zoom_factor=1.0, hover_color=None, selector="QPushButton"):
+    """
+    Construye la hoja de estilo de un QPushButton; el resultado se reutiliza entre llamadas.
+    Con un selector más específico la misma hoja puede instalarse en un widget
+    padre y compartirse entre varios botones.
+    """
     # Create proper Qt stylesheet with selectors
-    stylesheet = "QPushButton { "
+    stylesheet = f"{selector} {{ "
     
     # Add base properties
     if background:
@@ -73,23 +80,29 @@ def create_button(text, font_size=None, icon=None, background=None,
     
     # Add hover state as a separate selector
     if hover_color:
-        stylesheet += f" QPushButton:hover {{ background-color: {hover_color}; }}"
+        stylesheet += f" {selector}:hover {{ background-color: {hover_color}; }}"
     
     # Add disabled state with clear visual indication
-    stylesheet += f" QPushButton:disabled {{ color: rgba(255, 255, 255, 0.3); background-color: transparent; }}"
+    stylesheet += f" {selector}:disabled {{ color: rgba(255, 255, 255, 0.3); background-color: transparent; }}"
     
-    button.setStyleSheet(stylesheet)
+    return stylesheet
+
+def create_button(text, font_size=None, icon=None, background=None, 
+                 color="white", padding=None, border_radius=None, 
+                 zoom_factor=1.0, hover_color=None):
+    """Crea un QPushButton con estilo."""
+    button = QPushButton(text)
+    button.setStyleSheet(button_stylesheet(font_size, background, color, padding,
+                                           border_radius, zoom_factor, hover_color))
     
     if icon:
         button.setIcon(QIcon(icon))
     
     return button
 
-def create_container(border_radius=None, background=None, shadow=None, zoom_factor=1.0):
-    """Crea un contenedor con estilo y sombra opcional."""
-    container = QFrame()
-    
-    # Aplicar estilo
+@lru_cache(maxsize=32)
+def container_stylesheet(border_radius=None, background=None, zoom_factor=1.0):
+    """Construye la hoja de estilo de un contenedor; el resultado se reutiliza entre llamadas."""
     style = []
     
     # Fondo
@@ -101,7 +114,14 @@ def create_container(border_radius=None, background=None, shadow=None, zoom_fact
         zoomed_radius = apply_zoom(border_radius, zoom_factor)
         style.append(f"border-radius: {zoomed_radius}px")
     
-    container.setStyleSheet("; ".join(style))
+    return "; ".join(style)
+
+def create_container(border_radius=None, background=None, shadow=None, zoom_factor=1.0):
+    """Crea un contenedor con estilo y sombra opcional."""
+    container = QFrame()
+    
+    # Aplicar estilo
+    container.setStyleSheet(container_stylesheet(border_radius, background, zoom_factor))
     
     # Aplicar sombra si se solicita
     if shadow and isinstance(shadow, dict):
@@ -1,23 +1,191 @@
-import requests
-from PyQt5.QtCore import Qt, QSize, QTimer, QEvent
-from PyQt5.QtGui import QCursor, QPalette, QColor
-from PyQt5.QtWidgets import (QLabel, QCheckBox, 
+import os
+import re
+import tempfile
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from PyQt5.QtCore import Qt, QSize, QRect, QTimer, QEvent, QUrl, QRunnable, QThreadPool, pyqtSlot
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt5.QtGui import QCursor, QPalette, QColor, QPixmap, QPixmapCache, QDesktopServices
+from PyQt5.QtWidgets import (QLabel, QCheckBox, QPushButton, 
                              QVBoxLayout, QHBoxLayout, QWidget, QMenu, 
                              QAction, QDialog, QFrame, QMessageBox,
-                             QApplication, QSizePolicy)
+                             QApplication, QSizePolicy, QGraphicsDropShadowEffect)
 from constants import Constants
 from sys_platform.windows.startup import StartupManager
-from core.wallpaper_favorites import WallpaperFavorites
 from pathlib import Path
 from utils.logger import log_error, log_info
-from utils.resource_utils import open_url, open_folder
-from ui.components import create_label, create_button, create_container, load_pixmap
-from utils.file_utils import file_exists
-from utils.http_client import download_file
+from ui.components import (create_label, create_button, create_container,
+                           label_stylesheet, button_stylesheet, container_stylesheet)
+from utils.file_utils import file_exists, clear_file_exists_cache
+
+# Datos de los que depende el estado de los botones de navegación
+_NavState = namedtuple("_NavState", "source idx n_hist n_fav")
+
+# Imágenes originales ya decodificadas, por (ruta, fecha de modificación)
+_source_pixmaps = OrderedDict()
+
+def _source_pixmap(path, mtime):
+    """
+    Decodifica una imagen una sola vez, de modo que un cambio de zoom solo
+    tiene que volver a escalarla. Se guardan únicamente las más recientes.
+    """
+    key = (path, mtime)
+    pixmap = _source_pixmaps.get(key)
+    if pixmap is not None:
+        _source_pixmaps.move_to_end(key)
+        return pixmap
+    
+    pixmap = QPixmap(path)
+    if not pixmap.isNull():
+        _source_pixmaps[key] = pixmap
+        if len(_source_pixmaps) > Constants.UI.SOURCE_PIXMAP_CACHE_SIZE:
+            _source_pixmaps.popitem(last=False)
+    return pixmap
+
+class _ScaledThumbnailWriter(QRunnable):
+    """
+    Guarda en disco una miniatura escalada fuera del hilo de la interfaz y
+    poda la carpeta de miniaturas: se borran los otros tamaños de la misma
+    imagen y, si se supera el límite, los archivos más antiguos.
+    """
+    
+    def __init__(self, image, scaled_file):
+        super().__init__()
+        # QImage, a diferencia de QPixmap, se puede usar desde otro hilo
+        self.image = image
+        self.scaled_file = scaled_file
+    
+    def run(self):
+        try:
+            if not self.image.save(str(self.scaled_file), "PNG"):
+                log_error(f"Error al guardar miniatura escalada {self.scaled_file}")
+                return
+            
+            thumbnails_dir = self.scaled_file.parent
+            stem = self.scaled_file.stem.rsplit("_", 1)[0]
+            entries = []
+            for entry in os.scandir(thumbnails_dir):
+                if not entry.is_file() or entry.path == str(self.scaled_file):
+                    continue
+                # Otro tamaño de la misma imagen, de un zoom anterior
+                if entry.name.rsplit("_", 1)[0] == stem:
+                    Path(entry.path).unlink(missing_ok=True)
+                else:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+            
+            excess = len(entries) + 1 - Constants.UI.SCALED_THUMBNAIL_FILES_LIMIT
+            if excess > 0:
+                for _, old_path in sorted(entries)[:excess]:
+                    Path(old_path).unlink(missing_ok=True)
+        except OSError as e:
+            log_error(f"Error al podar miniaturas escaladas: {str(e)}")
+
+def _scaled_pixmap(path, mtime, width, height):
+    """
+    Carga y escala una miniatura, reutilizando el resultado entre llamadas.
+    La fecha de modificación forma parte de la clave para no mostrar una
+    miniatura que se reemplazó en disco.
+    
+    Los pixmaps se guardan en QPixmapCache, compartida por toda la aplicación
+    y limitada por memoria, de modo que Qt descarta los más antiguos cuando
+    hace falta espacio.
+    
+    El escalado se guarda en disco la primera vez, en segundo plano, de modo
+    que las siguientes ejecuciones solo decodifican una imagen pequeña ya del
+    tamaño final.
+    """
+    cache_key = f"{path}|{mtime}|{width}x{height}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    pixmap = None
+    scaled_file = Constants.get_scaled_thumbnail_file(path, width, height)
+    try:
+        if scaled_file.stat().st_mtime_ns >= mtime:
+            pixmap = QPixmap(str(scaled_file))
+    except OSError:
+        pass
+    
+    if pixmap is None or pixmap.isNull():
+        pixmap = _source_pixmap(path, mtime).scaled(
+            width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if not pixmap.isNull():
+            QThreadPool.globalInstance().start(
+                _ScaledThumbnailWriter(pixmap.toImage(), scaled_file))
+    
+    if not pixmap.isNull():
+        QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+@lru_cache(maxsize=8)
+def _zoom_dimensions(zoom):
+    """
+    Calcula una sola vez por factor de zoom los tamaños en píxeles de la interfaz.
+    
+    Args:
+        zoom: Factor de zoom
+        
+    Returns:
+        dict: Tamaños, márgenes y espaciados ya escalados
+    """
+    thumb_height = int(Constants.UI.THUMB_HEIGHT * zoom)
+    return {
+        "window_width": int(Constants.UI.NAV_BASE_WIDTH * zoom),
+        "window_height": int(Constants.UI.NAV_BASE_HEIGHT * zoom),
+        "shadow_blur": int(Constants.UI.SHADOW_BLUR * zoom),
+        "shadow_offset": int(Constants.UI.SHADOW_OFFSET * zoom),
+        "margin": int(Constants.UI.MARGIN * zoom),
+        "container_spacing": int(6 * zoom),
+        "header_spacing": int(4 * zoom),
+        "button_size": int(Constants.UI.BUTTON_SIZE * zoom),
+        "content_padding": int(8 * zoom),
+        "content_spacing": int(12 * zoom),
+        "thumb_width": int(Constants.UI.THUMB_WIDTH * zoom),
+        "thumb_height": thumb_height,
+        "info_spacing": int(8 * zoom),
+        "title_min_height": int(thumb_height * 0.618),  # Proporción áurea
+        "border_radius": int(Constants.UI.BORDER_RADIUS * zoom),
+        "button_font_size": int(Constants.UI.BUTTON_FONT_SIZE * zoom),
+        "menu_border_radius": int(Constants.UI.MENU_BORDER_RADIUS * zoom),
+        "menu_padding": int(Constants.UI.MENU_PADDING * zoom),
+        "menu_font_size": int(Constants.UI.MENU_FONT_SIZE * zoom),
+        "menu_item_padding_v": int(Constants.UI.MENU_ITEM_PADDING_V * zoom),
+        "menu_item_padding_h": int(Constants.UI.MENU_ITEM_PADDING_H * zoom),
+        "menu_item_border_radius": int(Constants.UI.MENU_ITEM_BORDER_RADIUS * zoom)
+    }
+
+# Título y primer bloque "(© ...)" del texto de copyright de Bing
+_COPYRIGHT_RE = re.compile(r"(.*?)\(©(.*?)(?:\(©|\Z)", re.DOTALL)
+
+@lru_cache(maxsize=64)
+def _split_copyright(copyright):
+    """
+    Separa el texto de copyright de Bing en título y autoría.
+    
+    Args:
+        copyright: Texto completo, por ejemplo "Título (© Autor)"
+        
+    Returns:
+        tuple: (título, texto de copyright)
+    """
+    match = _COPYRIGHT_RE.match(copyright)
+    if match is None:
+        return copyright.strip(), ""
+    title = match.group(1).strip()
+    copyright_text = "©" + match.group(2)
+    return title, copyright_text
 
 class WallpaperNavigatorWindow(QDialog):
     """Ventana para navegar por los fondos de pantalla."""
     
+    # Hojas de estilo ya construidas, por (nombre, zoom, estado)
+    _stylesheet_cache = {}
+    
+    # Valor de la propiedad "class" de los botones de la barra superior
+    HEADER_BUTTON_CLASS = "headerbtn"
+    
     def __init__(self, wallpaper_manager):
         super().__init__()
         self.wallpaper_manager = wallpaper_manager
@@ -28,9 +196,49 @@ class WallpaperNavigatorWindow(QDialog):
         # Guardamos una referencia al factor de zoom
         self.zoom_factor = self.wallpaper_manager.get_zoom_factor()
         
+        # Descargas de miniaturas en segundo plano, por URL, y miniatura que se muestra
+        self._network_manager = QNetworkAccessManager(self)
+        self._thumb_replies = {}
+        self._thumb_file = None
+        
+        # Clave (ruta, fecha de modificación, ancho, alto) de la miniatura mostrada
+        self._thumb_key = None
+        
+        # Los cambios de zoom seguidos se agrupan en una sola reconstrucción
+        self._pending_zoom = self.zoom_factor
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(Constants.UI.ZOOM_DEBOUNCE_DELAY)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+        
         # Registramos el callback para cuando cambie el zoom
         self.wallpaper_manager.zoom_changed.connect(self.on_zoom_changed)
         
+        # En un inicio en frío el contenido se actualiza al llegar los datos, sin sondeo;
+        # si no llegan a tiempo se muestra un aviso
+        self._waiting_for_data = False
+        self._load_timeout_timer = QTimer(self)
+        self._load_timeout_timer.setSingleShot(True)
+        self._load_timeout_timer.setInterval(Constants.UI.INITIAL_LOAD_TIMEOUT)
+        self._load_timeout_timer.timeout.connect(self._on_load_timeout)
+        self.wallpaper_manager.download_completed.connect(self._on_data_available)
+        self.wallpaper_manager.wallpaper_changed.connect(self._on_data_available)
+        
+        # Wallpaper (fuente, índice, zoom, URL, copyright) que se está mostrando
+        self._render_key = None
+        
+        # Último estado con el que se actualizaron los botones de navegación
+        self._nav_state = None
+        
+        # Arrastre de la ventana: última posición pendiente de aplicar
+        self._pending_pos = None
+        self._move_scheduled = False
+        
+        # Área disponible de la pantalla principal, actualizada solo cuando cambia
+        screen = QApplication.primaryScreen()
+        self._screen_rect = screen.availableGeometry()
+        screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
+        
         # Inicializamos la interfaz
         self.init_ui()
         self.update_content()
@@ -39,46 +247,166 @@ class WallpaperNavigatorWindow(QDialog):
     def update_window_size(self):
         """Actualiza el tamaño de la ventana según el factor de zoom."""
         # Aplicar el factor de zoom a las dimensiones base
-        base_width, base_height = Constants.UI.NAV_BASE_WIDTH, Constants.UI.NAV_BASE_HEIGHT
-        scaled_width = int(base_width * self.zoom_factor)
-        scaled_height = int(base_height * self.zoom_factor)
-        self.setFixedSize(scaled_width, scaled_height)
+        dims = _zoom_dimensions(self.zoom_factor)
+        self.setFixedSize(dims["window_width"], dims["window_height"])
         
         # Reposiciona la ventana
         self.position_window()
     
+    @pyqtSlot(float)
     def on_zoom_changed(self, new_zoom_factor):
         """Manejador para cuando cambia el factor de zoom."""
-        self.zoom_factor = new_zoom_factor
+        # Solo se aplica el último valor recibido mientras corre el temporizador
+        self._pending_zoom = new_zoom_factor
+        self._zoom_timer.start()
+    
+    @pyqtSlot()
+    def _apply_pending_zoom(self):
+        """Aplica el último factor de zoom recibido."""
+        if self._pending_zoom == self.zoom_factor:
+            return
+        self.zoom_factor = self._pending_zoom
         
         # Recreamos la interfaz con el nuevo factor de zoom
         self.recreate_ui()
     
     def recreate_ui(self):
-        """Recrea la interfaz de usuario con el nuevo factor de zoom."""
-        # Limpiamos cualquier widget existente
-        if self.layout():
-            # Eliminar todos los widgets del layout
-            while self.layout().count():
-                item = self.layout().takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+        """Aplica el nuevo factor de zoom a la interfaz, reutilizando los widgets existentes."""
+        with self._batched_updates():
+            # Actualizamos el tamaño de la ventana
+            self.update_window_size()
+            
+            # Reescalamos la interfaz en el sitio
+            self._apply_zoom(self.zoom_factor)
+            self.update_content()
+    
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Desactiva el repintado de la ventana mientras se modifican varios widgets,
+        de modo que Qt los pinta una sola vez al terminar. Los bloques anidados
+        reutilizan el del nivel más externo.
+        """
+        if not self.updatesEnabled():
+            yield
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _get_stylesheet(self, name, build, state=None):
+        """
+        Obtiene una hoja de estilo de la caché, construyéndola solo la primera vez.
+        
+        Args:
+            name: Nombre del elemento al que se aplica la hoja de estilo
+            build: Función que recibe (zoom, state) y devuelve la hoja de estilo
+            state: Estado adicional del elemento que cambia su estilo
             
-            # Eliminar el layout
-            QWidget().setLayout(self.layout())
+        Returns:
+            str: Hoja de estilo para el factor de zoom actual
+        """
+        key = (name, round(self.zoom_factor, 2), state)
+        stylesheet = WallpaperNavigatorWindow._stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = build(self.zoom_factor, state)
+            WallpaperNavigatorWindow._stylesheet_cache[key] = stylesheet
+        return stylesheet
+    
+    @staticmethod
+    def _container_style(zoom, state=None):
+        """
+        Construye la hoja de estilo del contenedor. Las reglas llevan selector
+        para que el fondo solo se aplique al contenedor y la regla de los botones
+        de la barra superior, incluido :hover, llegue a los botones: Qt da
+        prioridad a la hoja del ancestro más cercano.
+        """
+        container_rule = container_stylesheet(
+            Constants.UI.BORDER_RADIUS, Constants.UI.BACKGROUND_COLOR, zoom)
+        header_button_rules = button_stylesheet(
+            Constants.UI.BUTTON_FONT_SIZE, None, Constants.UI.TEXT_COLOR, None,
+            Constants.UI.BORDER_RADIUS, zoom, Constants.UI.HOVER_COLOR,
+            f'QPushButton[class="{WallpaperNavigatorWindow.HEADER_BUTTON_CLASS}"]')
+        return f"QFrame#container {{ {container_rule} }} {header_button_rules}"
+    
+    @staticmethod
+    def _thumbnail_style(zoom, state=None):
+        """Construye la hoja de estilo de la miniatura."""
+        return f"""
+            border-radius: {_zoom_dimensions(zoom)["margin"]}px;
+            background-color: {Constants.UI.THUMB_BG_COLOR};
+        """
+    
+    # Plantilla de la hoja de estilo del menú de configuración
+    _MENU_STYLESHEET = """
+        QMenu {{
+            background-color: {bg_color};
+            color: white;
+            border: {border_width}px solid {border_color};
+            border-radius: {menu_border_radius}px;
+            padding: {menu_padding}px;
+            font-size: {menu_font_size}px;
+        }}
+        QMenu::item {{
+            padding: {menu_item_padding_v}px {menu_item_padding_h}px;
+            border-radius: {menu_item_border_radius}px;
+        }}
+        QMenu::item:selected {{
+            background-color: {hover_color};
+        }}
+    """
+    
+    @staticmethod
+    def _menu_style(zoom, state=None):
+        """Construye la hoja de estilo del menú de configuración."""
+        return WallpaperNavigatorWindow._MENU_STYLESHEET.format(
+            bg_color=Constants.UI.MENU_BG_COLOR,
+            border_width=Constants.UI.MENU_BORDER_WIDTH,
+            border_color=Constants.UI.MENU_BORDER_COLOR,
+            hover_color=Constants.UI.HOVER_COLOR,
+            **_zoom_dimensions(zoom)
+        )
+    
+    @staticmethod
+    def _favorite_button_style(zoom, is_favorite):
+        """Construye la hoja de estilo del botón de favorito según su estado."""
+        dims = _zoom_dimensions(zoom)
+        border_radius = dims["border_radius"]
+        font_size = dims["button_font_size"]
         
-        # Actualizamos el tamaño de la ventana
-        self.update_window_size()
+        stylesheet = (
+            f"QPushButton {{ "
+            f"background-color: transparent; "
+            f"font-weight: bold; "
+            f"border: none; "
+            f"border-radius: {border_radius}px; "
+            f"font-size: {font_size}px; "
+        )
         
-        # Recreamos la interfaz
-        self.init_ui()
-        self.update_content()
+        if is_favorite:
+            stylesheet += f"color: {Constants.UI.FAVORITE_COLOR}; }}"
+        else:
+            stylesheet += f"color: white; }}"
+        
+        stylesheet += (
+            f" QPushButton:hover {{ "
+            f"background-color: {Constants.UI.HOVER_COLOR}; "
+            f"color: {Constants.UI.FAVORITE_HOVER_COLOR}; "
+            f"}}"
+        )
+        return stylesheet
+    
+    @pyqtSlot(QRect)
+    def _on_screen_geometry_changed(self, rect):
+        """Guarda el nuevo área disponible de la pantalla y recoloca la ventana."""
+        self._screen_rect = rect
+        self.position_window()
     
     def position_window(self):
         """Posiciona la ventana sobre el system tray."""
-        desktop = QApplication.desktop()
-        screen_rect = desktop.availableGeometry()
+        screen_rect = self._screen_rect
         
         # Calculate position ensuring window stays within screen bounds
         x_pos = min(screen_rect.width() - self.width() - Constants.UI.TRAY_OFFSET_X,
@@ -102,31 +430,27 @@ class WallpaperNavigatorWindow(QDialog):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        # Contenedor principal con borde redondeado y sombra
-        container = create_container(
+        # Contenedor principal con borde redondeado
+        self.container = create_container(
             border_radius=Constants.UI.BORDER_RADIUS,
             background=Constants.UI.BACKGROUND_COLOR,
-            shadow={
-                'blur': Constants.UI.SHADOW_BLUR,
-                'color': QColor(*Constants.UI.SHADOW_COLOR),
-                'offset': Constants.UI.SHADOW_OFFSET
-            },
             zoom_factor=zoom
         )
-        container.setObjectName("container")
+        self.container.setObjectName("container")
         
-        container_layout = QVBoxLayout(container)
-        margin = int(Constants.UI.MARGIN * zoom)
-        container_layout.setContentsMargins(margin, margin, margin, margin)
-        container_layout.setSpacing(int(6 * zoom))  # Espaciado entre elementos
+        # Sombra única del contenedor; _apply_zoom solo ajusta su radio y desplazamiento
+        self._shadow = QGraphicsDropShadowEffect(self.container)
+        self._shadow.setColor(QColor(*Constants.UI.SHADOW_COLOR))
+        self.container.setGraphicsEffect(self._shadow)
+        
+        self.container_layout = QVBoxLayout(self.container)
         
         # Barra superior con título y botones
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        header_layout.setSpacing(int(4 * zoom))  # Espaciado entre elementos
+        self.header_layout = QHBoxLayout()
+        self.header_layout.setContentsMargins(0, 0, 0, 0)
         
         # Logo de Bing
-        bing_label = create_label(
+        self.bing_label = create_label(
             Constants.UI.MAIN_WINDOW_TITLE,
             Constants.UI.BING_TITLE_FONT_SIZE,
             bold=True,
@@ -135,33 +459,14 @@ class WallpaperNavigatorWindow(QDialog):
         )
         
         # Botones de la barra superior
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(int(4 * zoom))  # Espaciado entre elementos
-        
-        btn_size = int(Constants.UI.BUTTON_SIZE * zoom)
+        self.buttons_layout = QHBoxLayout()
         
         # Botón minimizar
-        minimize_btn = create_button(
-            "−",
-            font_size=Constants.UI.BUTTON_FONT_SIZE,
-            color=Constants.UI.TEXT_COLOR,
-            border_radius=Constants.UI.BORDER_RADIUS,
-            zoom_factor=zoom,
-            hover_color=Constants.UI.HOVER_COLOR
-        )
-        minimize_btn.setFixedSize(btn_size, btn_size)
+        minimize_btn = QPushButton("−")
         minimize_btn.clicked.connect(self.hide)
         
         # Botón compartir
-        share_btn = create_button(
-            "⤴",
-            font_size=Constants.UI.BUTTON_FONT_SIZE,
-            color=Constants.UI.TEXT_COLOR,
-            border_radius=Constants.UI.BORDER_RADIUS,
-            zoom_factor=zoom,
-            hover_color=Constants.UI.HOVER_COLOR
-        )
-        share_btn.setFixedSize(btn_size, btn_size)
+        share_btn = QPushButton("⤴")
         share_btn.clicked.connect(self.open_wallpaper_url)
         
         # Botón de favorito
@@ -173,59 +478,40 @@ class WallpaperNavigatorWindow(QDialog):
             zoom_factor=zoom,
             hover_color=Constants.UI.HOVER_COLOR
         )
-        self.favorite_btn.setFixedSize(btn_size, btn_size)
         self.favorite_btn.clicked.connect(self.toggle_favorite)
         
         # Botón de configuración con menú
-        settings_btn = create_button(
-            "⚙",
-            font_size=Constants.UI.BUTTON_FONT_SIZE,
-            color=Constants.UI.TEXT_COLOR,
-            border_radius=Constants.UI.BORDER_RADIUS,
-            zoom_factor=zoom,
-            hover_color=Constants.UI.HOVER_COLOR
-        )
-        settings_btn.setFixedSize(btn_size, btn_size)
+        settings_btn = QPushButton("⚙")
         settings_btn.clicked.connect(self.show_settings_menu)
         
-        buttons_layout.addWidget(minimize_btn)
-        buttons_layout.addWidget(share_btn)
-        buttons_layout.addWidget(self.favorite_btn)
-        buttons_layout.addWidget(settings_btn)
+        # Botones con el estilo común de la barra superior (el de favorito tiene el suyo);
+        # la hoja de estilo se instala una sola vez en el contenedor y se aplica por la propiedad
+        self.header_buttons = [minimize_btn, share_btn, settings_btn]
+        for button in self.header_buttons:
+            button.setProperty("class", self.HEADER_BUTTON_CLASS)
         
-        header_layout.addWidget(bing_label)
-        header_layout.addStretch(1)
-        header_layout.addLayout(buttons_layout)
+        self.buttons_layout.addWidget(minimize_btn)
+        self.buttons_layout.addWidget(share_btn)
+        self.buttons_layout.addWidget(self.favorite_btn)
+        self.buttons_layout.addWidget(settings_btn)
+        
+        self.header_layout.addWidget(self.bing_label)
+        self.header_layout.addStretch(1)
+        self.header_layout.addLayout(self.buttons_layout)
         
         # Contenido principal con la imagen y la descripción
-        content_layout = QHBoxLayout()
-        content_margin = int(Constants.UI.MARGIN * zoom)
-        content_padding = int(8 * zoom)  # Padding vertical
-        content_layout.setContentsMargins(
-            content_margin, 
-            content_padding, 
-            content_margin, 
-            content_margin)
-        content_layout.setSpacing(int(12 * zoom))  # Espaciado entre elementos
+        self.content_layout = QHBoxLayout()
         
         # Ajuste de proporción áurea (38% / 62%)
         golden_width_factor = 1 / (1 + golden_ratio)  # Aproximadamente 0.38
         
         # Imagen miniatura - Escalada con el factor de zoom y proporción áurea
         self.thumbnail_label = QLabel()
-        thumb_width = int(Constants.UI.THUMB_WIDTH * zoom)
-        thumb_height = int(Constants.UI.THUMB_HEIGHT * zoom)
-        self.thumbnail_label.setFixedSize(thumb_width, thumb_height)
-        self.thumbnail_label.setStyleSheet(f"""
-            border-radius: {int(Constants.UI.MARGIN * zoom)}px;
-            background-color: {Constants.UI.THUMB_BG_COLOR};
-        """)
         self.thumbnail_label.setAlignment(Qt.AlignCenter)
         
         # Información del wallpaper
-        info_layout = QVBoxLayout()
-        info_layout.setContentsMargins(0, 0, 0, 0)
-        info_layout.setSpacing(int(8 * zoom))  # Aumentado para más espacio entre elementos
+        self.info_layout = QVBoxLayout()
+        self.info_layout.setContentsMargins(0, 0, 0, 0)
         
         # Título/descripción con espacio maximizado
         self.title_label = create_label(
@@ -237,7 +523,6 @@ class WallpaperNavigatorWindow(QDialog):
         )
         self.title_label.setWordWrap(True)
         self.title_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        self.title_label.setMinimumHeight(int(thumb_height * 0.618))  # Proporción áurea
         
         # Espaciador flexible
         flexible_spacer = QWidget()
@@ -252,19 +537,17 @@ class WallpaperNavigatorWindow(QDialog):
         )
         self.copyright_label.setAlignment(Qt.AlignBottom | Qt.AlignLeft)
         
-        info_layout.addWidget(self.title_label)
-        info_layout.addWidget(flexible_spacer)
-        info_layout.addWidget(self.copyright_label)
+        self.info_layout.addWidget(self.title_label)
+        self.info_layout.addWidget(flexible_spacer)
+        self.info_layout.addWidget(self.copyright_label)
         
         # Establecer proporciones según regla áurea
-        content_layout.addWidget(self.thumbnail_label, int(golden_width_factor * 100))
-        content_layout.addLayout(info_layout, int((1 - golden_width_factor) * 100))
+        self.content_layout.addWidget(self.thumbnail_label, int(golden_width_factor * 100))
+        self.content_layout.addLayout(self.info_layout, int((1 - golden_width_factor) * 100))
         
         # Barra de navegación
-        nav_layout = QHBoxLayout()
-        nav_margin = int(Constants.UI.MARGIN * zoom)
-        nav_layout.setContentsMargins(nav_margin, 0, nav_margin, nav_margin)
-        nav_layout.setSpacing(0)
+        self.nav_layout = QHBoxLayout()
+        self.nav_layout.setSpacing(0)
         
         self.prev_button = create_button(
             "⟨ Anterior",
@@ -288,76 +571,136 @@ class WallpaperNavigatorWindow(QDialog):
         )
         self.next_button.clicked.connect(self.navigate_to_next)
         
-        nav_layout.addWidget(self.prev_button)
-        nav_layout.addStretch(1)
-        nav_layout.addWidget(self.next_button)
+        self.nav_layout.addWidget(self.prev_button)
+        self.nav_layout.addStretch(1)
+        self.nav_layout.addWidget(self.next_button)
         
         # Agregamos todos los layouts al contenedor principal
-        container_layout.addLayout(header_layout)
-        container_layout.addLayout(content_layout, 1)
-        container_layout.addLayout(nav_layout)
+        self.container_layout.addLayout(self.header_layout)
+        self.container_layout.addLayout(self.content_layout, 1)
+        self.container_layout.addLayout(self.nav_layout)
         
         # Agregamos el contenedor al layout principal
-        main_layout.addWidget(container)
+        main_layout.addWidget(self.container)
+        
+        # Menú de configuración, reutilizado en cada clic
+        self._build_settings_menu()
+        
+        # Tamaños, márgenes y espaciados que dependen del zoom
+        self._apply_zoom(zoom)
     
-    def show_settings_menu(self):
-        """Muestra el menú de configuración."""
-        zoom = self.zoom_factor
+    @staticmethod
+    def _set_stylesheet(widget, stylesheet):
+        """Aplica una hoja de estilo solo si cambia, para que Qt no la vuelva a analizar."""
+        if widget.styleSheet() != stylesheet:
+            widget.setStyleSheet(stylesheet)
+    
+    def _apply_zoom(self, zoom):
+        """
+        Aplica un factor de zoom a los widgets existentes, sin volver a crearlos.
+        
+        Args:
+            zoom: Factor de zoom a aplicar
+        """
+        dims = _zoom_dimensions(zoom)
+        
+        # Contenedor principal, con el estilo compartido de los botones de la barra
+        # superior, y su sombra
+        self._set_stylesheet(self.container, self._get_stylesheet("container", self._container_style))
+        self._shadow.setBlurRadius(dims["shadow_blur"])
+        self._shadow.setOffset(0, dims["shadow_offset"])
+        
+        margin = dims["margin"]
+        self.container_layout.setContentsMargins(margin, margin, margin, margin)
+        self.container_layout.setSpacing(dims["container_spacing"])  # Espaciado entre elementos
+        
+        # Barra superior con título y botones
+        self.header_layout.setSpacing(dims["header_spacing"])  # Espaciado entre elementos
+        self._set_stylesheet(self.bing_label, label_stylesheet(
+            Constants.UI.BING_TITLE_FONT_SIZE, True, Constants.UI.TEXT_COLOR, zoom))
+        self.buttons_layout.setSpacing(dims["header_spacing"])  # Espaciado entre elementos
+        
+        btn_size = dims["button_size"]
+        for button in self.header_buttons:
+            button.setFixedSize(btn_size, btn_size)
+        # El estilo del botón de favorito lo aplica update_favorite_button
+        self.favorite_btn.setFixedSize(btn_size, btn_size)
+        
+        # Contenido principal con la imagen y la descripción
+        self.content_layout.setContentsMargins(margin, dims["content_padding"], margin, margin)
+        self.content_layout.setSpacing(dims["content_spacing"])  # Espaciado entre elementos
+        
+        self.thumbnail_label.setFixedSize(dims["thumb_width"], dims["thumb_height"])
+        self._set_stylesheet(self.thumbnail_label, self._get_stylesheet("thumbnail", self._thumbnail_style))
+        
+        self.info_layout.setSpacing(dims["info_spacing"])  # Aumentado para más espacio entre elementos
+        self._set_stylesheet(self.title_label, label_stylesheet(
+            Constants.UI.NAV_TITLE_FONT_SIZE, True, Constants.UI.TEXT_COLOR, zoom))
+        self.title_label.setMinimumHeight(dims["title_min_height"])  # Proporción áurea
+        self._set_stylesheet(self.copyright_label, label_stylesheet(
+            Constants.UI.NAV_COPYRIGHT_FONT_SIZE, False, "rgba(255, 255, 255, 0.7)", zoom))
         
-        settings_menu = QMenu(self)
-        settings_menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {Constants.UI.MENU_BG_COLOR};
-                color: white;
-                border: {Constants.UI.MENU_BORDER_WIDTH}px solid {Constants.UI.MENU_BORDER_COLOR};
-                border-radius: {int(Constants.UI.MENU_BORDER_RADIUS * zoom)}px;
-                padding: {int(Constants.UI.MENU_PADDING * zoom)}px;
-                font-size: {int(Constants.UI.MENU_FONT_SIZE * zoom)}px;
-            }}
-            QMenu::item {{
-                padding: {int(Constants.UI.MENU_ITEM_PADDING_V * zoom)}px {int(Constants.UI.MENU_ITEM_PADDING_H * zoom)}px;
-                border-radius: {int(Constants.UI.MENU_ITEM_BORDER_RADIUS * zoom)}px;
-            }}
-            QMenu::item:selected {{
-                background-color: {Constants.UI.HOVER_COLOR};
-            }}
-        """)
+        # Barra de navegación
+        self.nav_layout.setContentsMargins(margin, 0, margin, margin)
+        nav_button_style = button_stylesheet(
+            Constants.UI.NAV_BUTTON_FONT_SIZE, None, Constants.UI.TEXT_COLOR, (4, 8),
+            Constants.UI.MARGIN, zoom, Constants.UI.HOVER_COLOR)
+        self._set_stylesheet(self.prev_button, nav_button_style)
+        self._set_stylesheet(self.next_button, nav_button_style)
+        
+        # Menú de configuración
+        self._set_stylesheet(self._settings_menu, self._get_stylesheet("menu", self._menu_style))
+    
+    def _build_settings_menu(self):
+        """Crea el menú de configuración una sola vez; al mostrarlo solo se actualizan las marcas."""
+        self._settings_menu = QMenu(self)
         
         # Opciones del menú
-        run_startup_action = settings_menu.addAction("Iniciar con Windows")
-        run_startup_action.setCheckable(True)
-        run_startup_action.setChecked(StartupManager.get_run_on_startup())
-        run_startup_action.triggered.connect(lambda checked: StartupManager.set_run_on_startup(checked))
+        self._run_startup_action = self._settings_menu.addAction("Iniciar con Windows")
+        self._run_startup_action.setCheckable(True)
+        self._run_startup_action.triggered.connect(StartupManager.set_run_on_startup)
         
         # Opción para ajustar zoom
-        zoom_menu = settings_menu.addMenu("Ajustar tamaño")
+        zoom_menu = self._settings_menu.addMenu("Ajustar tamaño")
         
+        self._zoom_actions = {}
         for name, factor in Constants.ZOOM_OPTIONS:
             zoom_action = zoom_menu.addAction(name)
             zoom_action.setCheckable(True)
-            zoom_action.setChecked(abs(self.zoom_factor - factor) < 0.1)
-            
-            # Función para aplicar el cambio de zoom
-            def apply_zoom(checked, new_factor=factor):
-                if checked:
-                    self.wallpaper_manager.set_zoom_factor(new_factor)
-            
-            zoom_action.triggered.connect(apply_zoom)
+            zoom_action.setData(factor)
+            self._zoom_actions[factor] = zoom_action
+        
+        # Un solo slot para todas las opciones de zoom
+        zoom_menu.triggered.connect(self._on_zoom_action_triggered)
         
-        settings_menu.addSeparator()
+        self._settings_menu.addSeparator()
         
         # Opción para abrir la carpeta de favoritos
-        favorites_action = settings_menu.addAction("Abrir carpeta de favoritos")
-        favorites_action.triggered.connect(WallpaperFavorites.open_favorites_folder)
+        favorites_action = self._settings_menu.addAction("Abrir carpeta de favoritos")
+        favorites_action.triggered.connect(self.open_favorites_folder)
         
-        settings_menu.addSeparator()
+        self._settings_menu.addSeparator()
         
-        exit_action = settings_menu.addAction("Salir de la aplicación")
+        exit_action = self._settings_menu.addAction("Salir de la aplicación")
         exit_action.triggered.connect(QApplication.instance().quit)
+    
+    @pyqtSlot()
+    def show_settings_menu(self):
+        """Muestra el menú de configuración."""
+        self._run_startup_action.setChecked(StartupManager.get_run_on_startup())
+        for factor, zoom_action in self._zoom_actions.items():
+            zoom_action.setChecked(abs(self.zoom_factor - factor) < 0.1)
         
         # Muestra el menú en la posición del cursor
-        settings_menu.exec_(QCursor.pos())
+        self._settings_menu.exec_(QCursor.pos())
+    
+    @pyqtSlot(QAction)
+    def _on_zoom_action_triggered(self, action):
+        """Aplica el factor de zoom de la opción seleccionada en el menú."""
+        if action.isChecked():
+            self.wallpaper_manager.set_zoom_factor(action.data())
     
+    @pyqtSlot()
     def toggle_favorite(self):
         """Alterna el estado de favorito del wallpaper actual."""
         if self.wallpaper_manager.toggle_current_favorite():
@@ -367,34 +710,17 @@ class WallpaperNavigatorWindow(QDialog):
         """Actualiza el estado visual del botón de favorito."""
         is_favorite = self.wallpaper_manager.is_current_favorite() is not None
         
-        border_radius = int(Constants.UI.BORDER_RADIUS * self.zoom_factor)
-        font_size = int(Constants.UI.BUTTON_FONT_SIZE * self.zoom_factor)
-        
-        stylesheet = (
-            f"QPushButton {{ "
-            f"background-color: transparent; "
-            f"font-weight: bold; "
-            f"border: none; "
-            f"border-radius: {border_radius}px; "
-            f"font-size: {font_size}px; "
-        )
-        
+        # Icono y estilo solo se tocan si cambian; Qt vuelve a analizar la hoja de
+        # estilo y a repintar el botón en cada llamada aunque el valor sea el mismo
         if is_favorite:
-            self.favorite_btn.setText(Constants.UI.FAVORITE_ICON_ACTIVE)
-            stylesheet += f"color: {Constants.UI.FAVORITE_COLOR}; }}"
+            self._set_text(self.favorite_btn, Constants.UI.FAVORITE_ICON_ACTIVE)
         else:
-            self.favorite_btn.setText(Constants.UI.FAVORITE_ICON_INACTIVE)
-            stylesheet += f"color: white; }}"
-        
-        stylesheet += (
-            f" QPushButton:hover {{ "
-            f"background-color: {Constants.UI.HOVER_COLOR}; "
-            f"color: {Constants.UI.FAVORITE_HOVER_COLOR}; "
-            f"}}"
-        )
+            self._set_text(self.favorite_btn, Constants.UI.FAVORITE_ICON_INACTIVE)
         
-        self.favorite_btn.setStyleSheet(stylesheet)
+        self._set_stylesheet(self.favorite_btn, self._get_stylesheet(
+            "favorite_button", self._favorite_button_style, is_favorite))
     
+    @pyqtSlot()
     def update_content(self):
         """Actualiza el contenido de la ventana con el wallpaper actual."""
         # Obtenemos la información ACTUALIZADA del wallpaper actual
@@ -402,105 +728,89 @@ class WallpaperNavigatorWindow(QDialog):
         
         # Manejar el caso de inicio en frío
         if not current_wallpaper:
-            # Verificamos si ya tenemos un contador de intentos
-            retry_count = getattr(self, "_retry_count", 0)
-            
-            if retry_count > 10:  # Máximo 10 intentos (10 segundos)
-                # Después de varios intentos, mostramos mensaje más claro
-                self.title_label.setText("No se pudo cargar el wallpaper")
-                self.copyright_label.setText("Intente más tarde o reinicie la aplicación")
-                # Reseteamos contador para futuros intentos
-                self._retry_count = 0
+            if self._waiting_for_data:
                 return
             
-            # Mostramos mensaje de carga con contador
-            self.title_label.setText(f"Descargando imagen de Bing... ({retry_count+1})")
-            self.copyright_label.setText("Por favor espere mientras se obtienen los datos iniciales")
+            # Mostramos mensaje de carga; _on_data_available vuelve a llamar a
+            # update_content cuando el gestor avisa de que hay datos
+            self._waiting_for_data = True
+            self._load_timeout_timer.start()
+            self._set_text(self.title_label, "Descargando imagen de Bing...")
+            self._set_text(self.copyright_label, "Por favor espere mientras se obtienen los datos iniciales")
             
             # Limpiamos miniatura anterior si existe
-            self.thumbnail_label.clear()
-            self.thumbnail_label.setText("Cargando...")
-            
-            # Incrementamos contador para siguiente intento
-            self._retry_count = retry_count + 1
-            
-            # Programamos nuevo intento en 1 segundo
-            QTimer.singleShot(1000, self.update_content)
+            self._set_thumbnail_text("Cargando...")
+            self._render_key = None
             return
         
-        # Si llegamos aquí, tenemos datos - reseteamos contador
-        self._retry_count = 0
-        
-        # Aplicar factor de zoom
-        zoom = self.zoom_factor
+        # Si llegamos aquí, tenemos datos
+        self._waiting_for_data = False
+        self._load_timeout_timer.stop()
+        
+        # Si ya se muestra este mismo wallpaper al mismo zoom, con su miniatura,
+        # solo pueden haber cambiado la navegación y el estado de favorito
+        render_key = (
+            self.wallpaper_manager.current_source,
+            self.wallpaper_manager.current_wallpaper_index,
+            round(self.zoom_factor, 2),
+            current_wallpaper.get("picture_url"),
+            current_wallpaper.get("copyright")
+        )
+        if render_key == self._render_key and self._thumb_key is not None:
+            self.update_navigation_buttons()
+            self.update_favorite_button()
+            return
+        self._render_key = render_key
         
-        # Actualiza la miniatura
-        idx = self.wallpaper_manager.current_wallpaper_index
+        # Los cambios de los widgets se agrupan en un solo repintado
+        with self._batched_updates():
+            self._render_wallpaper(current_wallpaper)
         
-        # Obtener la ruta de la miniatura según la fuente
+        # Las miniaturas vecinas se preparan cuando la interfaz quede libre
+        QTimer.singleShot(0, self._prefetch_neighbors)
+
+    def _render_wallpaper(self, current_wallpaper):
+        """
+        Muestra la miniatura, el título y el copyright de un wallpaper y
+        actualiza los botones.
+        
+        Args:
+            current_wallpaper: Diccionario con información del wallpaper actual
+        """
+        # Obtener la ruta de la miniatura según la fuente; las de Bing se nombran
+        # por fecha, igual que las descarga el historial
         if self.wallpaper_manager.current_source == "bing":
-            thumb_file = Constants.get_thumbnail_file(idx)
+            thumb_file = Constants.get_dated_thumbnail_file(current_wallpaper["date"])
         else:  # Favorito
             # Usar el archivo original para los favoritos
             thumb_file = Path(current_wallpaper.get("file_path", ""))
         
+        self._thumb_file = thumb_file
         if file_exists(thumb_file):
-            pixmap = load_pixmap(
-                thumb_file, 
-                width=Constants.UI.THUMB_WIDTH, 
-                height=Constants.UI.THUMB_HEIGHT, 
-                keep_aspect_ratio=True, 
-                zoom_factor=zoom
-            )
-            self.thumbnail_label.setPixmap(pixmap)
+            self._show_thumbnail(thumb_file)
         else:
-            # Si no existe la miniatura, intentamos descargarla si tenemos URL
+            # Si no existe la miniatura, la descargamos en segundo plano si tenemos URL
             if self.wallpaper_manager.current_source == "bing" and "thumbnail_url" in current_wallpaper:
-                try:
-                    self.thumbnail_label.setText("Descargando miniatura...")
-                    QApplication.processEvents()  # Forzamos actualización de UI
-                    
-                    if download_file(current_wallpaper["thumbnail_url"], thumb_file):
-                        # Intentamos mostrar la imagen recién descargada
-                        pixmap = load_pixmap(
-                            thumb_file, 
-                            width=Constants.UI.THUMB_WIDTH, 
-                            height=Constants.UI.THUMB_HEIGHT, 
-                            keep_aspect_ratio=True, 
-                            zoom_factor=zoom
-                        )
-                        self.thumbnail_label.setPixmap(pixmap)
-                    else:
-                        self.thumbnail_label.setText("No se pudo cargar la imagen")
-                except Exception as e:
-                    log_error(f"Error al descargar miniatura: {str(e)}")
-                    self.thumbnail_label.setText("Error al descargar")
+                self._set_thumbnail_text("Descargando miniatura...")
+                self._download_thumbnail(current_wallpaper["thumbnail_url"], thumb_file)
             else:
-                self.thumbnail_label.setText("Imagen no disponible")
+                self._set_thumbnail_text("Imagen no disponible")
         
         # Parsea y formatea mejor el título y copyright
         if "copyright" in current_wallpaper:
-            title_parts = current_wallpaper["copyright"].split("(©")
-            title = title_parts[0].strip()
-            
-            # QUITAR ESTA PARTE - No truncar el título ya que usamos wordwrap
-            # max_length = int(Constants.UI.TITLE_CHAR_LIMIT_FACTOR / zoom)
-            # if len(title) > max_length:
-            #    title = title[:max_length-3] + "..."
-            
-            # Simplemente usamos el título completo
-            copyright_text = "©" + title_parts[1] if len(title_parts) > 1 else ""
-            
-            self.title_label.setText(title)
-            self.copyright_label.setText(copyright_text)
+            title, copyright_text = _split_copyright(current_wallpaper["copyright"])
         else:
-            self.title_label.setText("Sin título disponible")
-            self.copyright_label.setText("")
+            title = "Sin título disponible"
+            copyright_text = ""
         
         # Muestra la fuente actual en la interfaz
         if self.wallpaper_manager.current_source == "favorite":
-            if not self.title_label.text().startswith("⭐"):
-                self.title_label.setText(f"⭐ {self.title_label.text()}")
+            if not title.startswith("⭐"):
+                title = f"⭐ {title}"
+        
+        # Solo se tocan las etiquetas si el texto cambió, para no forzar un repintado
+        self._set_text(self.title_label, title)
+        self._set_text(self.copyright_label, copyright_text)
         
         # Actualiza los botones de navegación
         self.update_navigation_buttons()
@@ -508,39 +818,181 @@ class WallpaperNavigatorWindow(QDialog):
         # Actualiza el estado del botón de favorito
         self.update_favorite_button()
 
+    @pyqtSlot()
+    def _prefetch_neighbors(self):
+        """
+        Carga en caché las miniaturas del wallpaper anterior y siguiente para
+        que la navegación no tenga que esperar a disco. Las que faltan las
+        descarga el controlador de navegación, que ya pre-descarga los vecinos.
+        """
+        try:
+            is_bing = self.wallpaper_manager.current_source == "bing"
+            if is_bing:
+                wallpapers = self.wallpaper_manager.wallpaper_history
+            else:
+                wallpapers = self.wallpaper_manager.favorites
+            
+            idx = self.wallpaper_manager.current_wallpaper_index
+            for neighbor in (idx - 1, idx + 1):
+                if not 0 <= neighbor < len(wallpapers):
+                    continue
+                wallpaper = wallpapers[neighbor]
+                
+                if is_bing:
+                    thumb_file = Constants.get_dated_thumbnail_file(wallpaper["date"])
+                elif wallpaper.get("file_path"):
+                    thumb_file = Path(wallpaper["file_path"])
+                else:
+                    continue
+                
+                if file_exists(thumb_file):
+                    _scaled_pixmap(*self._thumbnail_key(thumb_file))
+        except Exception as e:
+            log_error(f"Error al precargar miniaturas vecinas: {str(e)}")
+
+    def _download_thumbnail(self, url, thumb_file):
+        """
+        Descarga una miniatura sin bloquear la interfaz. Al terminar se muestra
+        si sigue siendo la miniatura del wallpaper actual.
+        
+        Args:
+            url: URL de la miniatura
+            thumb_file: Ruta donde guardar la miniatura
+        """
+        if url in self._thumb_replies:
+            return
+        
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(QNetworkRequest.FollowRedirectsAttribute, True)
+        reply = self._network_manager.get(request)
+        self._thumb_replies[url] = reply
+        reply.finished.connect(lambda: self._on_thumbnail_downloaded(reply, url, thumb_file))
+    
+    def _on_thumbnail_downloaded(self, reply, url, thumb_file):
+        """Guarda la miniatura descargada y la muestra si sigue siendo la actual."""
+        self._thumb_replies.pop(url, None)
+        temp_path = None
+        try:
+            if reply.error() != QNetworkReply.NoError:
+                raise IOError(reply.errorString())
+            
+            # Se escribe en un archivo temporal con nombre único, que no choca con
+            # las pre-descargas del controlador, y luego reemplaza al destino
+            with tempfile.NamedTemporaryFile(dir=thumb_file.parent, prefix=thumb_file.name + ".",
+                                             suffix=".tmp", delete=False) as f:
+                temp_path = Path(f.name)
+                f.write(bytes(reply.readAll()))
+            os.replace(temp_path, thumb_file)
+            clear_file_exists_cache()
+        except Exception as e:
+            log_error(f"Error al descargar miniatura: {str(e)}")
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+            if thumb_file == self._thumb_file:
+                self._set_thumbnail_text("No se pudo cargar la imagen")
+            return
+        finally:
+            reply.deleteLater()
+        
+        if thumb_file == self._thumb_file:
+            self._show_thumbnail(thumb_file)
+    
+    @staticmethod
+    def _set_text(label, text):
+        """Cambia el texto de una etiqueta o botón solo si es distinto del actual."""
+        if label.text() != text:
+            label.setText(text)
+    
+    def _set_thumbnail_text(self, text):
+        """Muestra un texto en lugar de la miniatura."""
+        self._thumb_key = None
+        self._set_text(self.thumbnail_label, text)
+    
+    def _thumbnail_key(self, thumb_file):
+        """
+        Clave de caché de una miniatura al zoom actual.
+        
+        Args:
+            thumb_file: Ruta de la miniatura
+            
+        Returns:
+            tuple: (ruta, fecha de modificación, ancho, alto)
+        """
+        try:
+            mtime = os.stat(thumb_file).st_mtime_ns
+        except OSError:
+            mtime = 0
+        dims = _zoom_dimensions(self.zoom_factor)
+        return (str(thumb_file), mtime, dims["thumb_width"], dims["thumb_height"])
+    
+    def _show_thumbnail(self, thumb_file):
+        """
+        Muestra la miniatura escalada al zoom actual, desde la caché si ya se cargó.
+        No hace nada si ya se está mostrando la misma miniatura al mismo tamaño.
+        
+        Args:
+            thumb_file: Ruta de la miniatura
+        """
+        thumb_key = self._thumbnail_key(thumb_file)
+        if thumb_key == self._thumb_key:
+            return
+        self._thumb_key = thumb_key
+        self.thumbnail_label.setPixmap(_scaled_pixmap(*thumb_key))
+    
+    @pyqtSlot(dict)
+    def _on_data_available(self, _):
+        """Actualiza el contenido si se estaba esperando a los datos iniciales."""
+        if self._waiting_for_data:
+            self._waiting_for_data = False
+            self.update_content()
+    
+    @pyqtSlot()
+    def _on_load_timeout(self):
+        """Muestra un aviso si los datos iniciales no llegaron a tiempo."""
+        if self._waiting_for_data:
+            self._set_text(self.title_label, "No se pudo cargar el wallpaper")
+            self._set_text(self.copyright_label, "Intente más tarde o reinicie la aplicación")
+    
     def update_navigation_buttons(self):
         """Actualiza el estado de los botones de navegación."""
-        # Obtenemos información actualizada
-        wallpaper_count = self.wallpaper_manager.get_wallpaper_count()
-        current_idx = self.wallpaper_manager.current_wallpaper_index
+        # Obtenemos información actualizada en una sola lectura del gestor
+        manager = self.wallpaper_manager
+        nav_state = _NavState(
+            manager.current_source,
+            manager.current_wallpaper_index,
+            len(manager.wallpaper_history),
+            len(manager.favorites)
+        )
+        if nav_state == self._nav_state:
+            return
+        self._nav_state = nav_state
+        
+        if nav_state.source == "bing":
+            wallpaper_count = nav_state.n_hist
+        else:
+            wallpaper_count = nav_state.n_fav
         
         # "Anterior" navega a wallpapers más antiguos (índices mayores)
         can_go_previous = (
             # Hay más wallpapers en la colección actual
-            (current_idx < wallpaper_count - 1) or 
+            (nav_state.idx < wallpaper_count - 1) or 
             # O estamos en Bing y hay favoritos disponibles
-            (self.wallpaper_manager.current_source == "bing" and len(self.wallpaper_manager.favorites) > 0)
+            (nav_state.source == "bing" and nav_state.n_fav > 0)
         )
         
         # "Siguiente" navega a wallpapers más recientes (índices menores)
         can_go_next = (
             # Hay wallpapers anteriores en la colección actual
-            (current_idx > 0) or 
+            (nav_state.idx > 0) or 
             # O estamos en favoritos y hay wallpapers Bing disponibles
-            (self.wallpaper_manager.current_source == "favorite" and len(self.wallpaper_manager.wallpaper_history) > 0)
+            (nav_state.source == "favorite" and nav_state.n_hist > 0)
         )
         
+        # Qt repinta el botón y aplica el estilo :disabled al cambiar el estado
         self.prev_button.setEnabled(can_go_previous)
         self.next_button.setEnabled(can_go_next)
-        
-        # Forzar actualización visual
-        self.prev_button.style().unpolish(self.prev_button)
-        self.prev_button.style().polish(self.prev_button)
-        self.next_button.style().unpolish(self.next_button)
-        self.next_button.style().polish(self.next_button)
-        self.prev_button.update()
-        self.next_button.update()
 
+    @pyqtSlot()
     def navigate_to_previous(self):
         """Navega al wallpaper anterior (más antiguo)."""
         if self.wallpaper_manager.navigate_to_previous_wallpaper():
@@ -548,6 +1000,7 @@ class WallpaperNavigatorWindow(QDialog):
             # actualizamos el contenido de forma explícita
             self.update_content()
 
+    @pyqtSlot()
     def navigate_to_next(self):
         """Navega al wallpaper siguiente (más reciente)."""
         if self.wallpaper_manager.navigate_to_next_wallpaper():
@@ -564,14 +1017,28 @@ class WallpaperNavigatorWindow(QDialog):
     def mouseMoveEvent(self, event):
         """Gestiona el evento de movimiento del ratón para mover la ventana."""
         if hasattr(self, 'offset'):
-            self.move(self.pos() + event.pos() - self.offset)
+            # Se guarda solo la última posición; los movimientos que llegan antes
+            # de que se procese la cola se agrupan en un único move()
+            self._pending_pos = event.globalPos() - self.offset
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(0, self._flush_move)
         else:
             super().mouseMoveEvent(event)
     
+    @pyqtSlot()
+    def _flush_move(self):
+        """Mueve la ventana a la última posición pendiente del arrastre."""
+        self._move_scheduled = False
+        pos, self._pending_pos = self._pending_pos, None
+        if pos is not None:
+            self.move(pos)
+    
     def mouseReleaseEvent(self, event):
         """Gestiona el evento de liberación del ratón."""
         if hasattr(self, 'offset'):
             del self.offset
+            self._flush_move()
         else:
             super().mouseReleaseEvent(event)
     
@@ -588,6 +1055,7 @@ class WallpaperNavigatorWindow(QDialog):
         super().focusOutEvent(event)
 
 
+    @pyqtSlot()
     def open_wallpaper_url(self):
         """Abre la URL directa del wallpaper actual en el navegador."""
         try:
@@ -602,11 +1070,18 @@ class WallpaperNavigatorWindow(QDialog):
             image_url = current_wallpaper["picture_url"]
             log_info(f"Abriendo URL de imagen: {image_url}")
             
-            # Usa la función de utils/resource_utils.py
-            from utils.resource_utils import open_url
-            success = open_url(image_url)
-            
-            if not success:
+            # QDesktopServices abre la URL dentro del proceso, sin lanzar una orden del sistema
+            if not QDesktopServices.openUrl(QUrl(image_url)):
                 log_error("Fallo al abrir URL")
         except Exception as e:
-            log_error(f"Error al abrir URL: {str(e)}")
\ No newline at end of file
+            log_error(f"Error al abrir URL: {str(e)}")
+    
+    @pyqtSlot()
+    def open_favorites_folder(self):
+        """Abre la carpeta de favoritos en el explorador de archivos."""
+        try:
+            favorites_path = Constants.get_favorites_path()
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(favorites_path))):
+                log_error(f"Error al abrir carpeta {favorites_path}")
+        except Exception as e:
+            log_error(f"Error al abrir carpeta de favoritos: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,35 @@
+# async_downloader.py
+import asyncio
+from pathlib import Path
+from constants import Constants
+from utils.http_client import download_file
+
+async def download_many(pairs, max_concurrent=Constants.Network.DOWNLOAD_WORKERS, delay_seconds=0):
+    """
+    Descarga varios archivos de forma concurrente. Cada descarga pasa por
+    http_client.download_file, de modo que comparte la sesión, los reintentos
+    y el registro de descargas en curso con el resto de la aplicación. Las
+    descargas se ejecutan en el executor por defecto del bucle que la espera.
+
+    Args:
+        pairs: Lista de tuplas (url, ruta de destino)
+        max_concurrent: Número máximo de descargas simultáneas
+        delay_seconds: Pausa tras cada descarga para no sobrecargar el servidor
+
+    Returns:
+        list: Lista de bool con el resultado de cada descarga, en el mismo orden
+    """
+    if not pairs:
+        return []
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def one(url, destination_path):
+        async with semaphore:
+            result = await loop.run_in_executor(None, download_file, url, destination_path)
+            if delay_seconds > 0:
+                await asyncio.sleep(delay_seconds)
+            return result
+
+    return list(await asyncio.gather(*(one(url, Path(path)) for url, path in pairs)))
@@ -2,9 +2,17 @@
 import json
 import os
 import shutil
+import tempfile
+import time
+from functools import lru_cache
 from pathlib import Path
 from utils.logger import log_error, log_info
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional; si no está se usa json estándar
+    orjson = None
+
 def ensure_directory(directory_path):
     """Asegura que un directorio exista, creándolo si es necesario."""
     try:
@@ -17,6 +25,9 @@ def ensure_directory(directory_path):
 def read_json(file_path, default=None):
     """Lee y parsea un archivo JSON con manejo de errores."""
     try:
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(file_path, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -30,19 +41,98 @@ def read_json(file_path, default=None):
         return default if default is not None else {}
 
 def write_json(file_path, data, indent=4):
-    """Escribe datos en un archivo JSON con manejo de errores."""
+    """
+    Escribe datos en un archivo JSON con manejo de errores.
+    Se escribe en un archivo temporal que luego reemplaza al destino, para que
+    un cierre inesperado nunca deje el JSON a medio escribir.
+    Con orjson cualquier indentación se escribe con 2 espacios.
+    """
+    temp_name = None
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=indent)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            content = orjson.dumps(data, option=option)
+        else:
+            content = json.dumps(data, indent=indent).encode("utf-8")
+        with tempfile.NamedTemporaryFile('wb', dir=str(Path(file_path).parent),
+                                         suffix='.tmp', delete=False) as f:
+            temp_name = f.name
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, file_path)
+        clear_file_exists_cache()
         return True
     except Exception as e:
         log_error(f"Error al escribir archivo JSON {file_path}: {str(e)}")
+        if temp_name:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
         return False
 
-def copy_file(source, destination):
-    """Copia un archivo con manejo de errores."""
+def _copy_file_range(source, destination):
+    """
+    Copia un archivo con os.copy_file_range. En sistemas de archivos con
+    reflink (Btrfs, XFS) la copia se resuelve sin mover los datos.
+    """
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                # El origen se acortó o el sistema no copia más: la copia quedaría truncada
+                raise OSError(f"copy_file_range se detuvo con {remaining} bytes pendientes")
+            remaining -= copied
+    shutil.copystat(source, destination)
+
+def _sendfile_copy(source, destination):
+    """Copia un archivo con os.sendfile, sin pasar los datos por memoria de usuario."""
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0:
+                # El origen se acortó: la copia quedaría truncada
+                raise OSError(f"sendfile se detuvo con {size - offset} bytes pendientes")
+            offset += sent
+    shutil.copystat(source, destination)
+
+def copy_file(source, destination, link=False):
+    """
+    Copia un archivo con manejo de errores. Usa os.copy_file_range u
+    os.sendfile cuando están disponibles y shutil.copy2 en el resto de casos.
+    
+    Args:
+        source: Ruta del archivo de origen
+        destination: Ruta de destino
+        link: Si es True se intenta crear un enlace duro en lugar de copiar los datos.
+            Solo es seguro si el origen nunca se modifica en el mismo archivo
+            (las descargas lo reemplazan con os.replace).
+    """
     try:
+        if link:
+            try:
+                os.link(source, destination)
+                clear_file_exists_cache()
+                return True
+            except OSError:
+                # Distinto sistema de archivos, destino existente o sin soporte
+                pass
+        for fast_copy, name in ((_copy_file_range, "copy_file_range"), (_sendfile_copy, "sendfile")):
+            if not hasattr(os, name):
+                continue
+            try:
+                fast_copy(source, destination)
+                clear_file_exists_cache()
+                return True
+            except OSError:
+                # Sin soporte en el kernel o en este tipo de archivo
+                pass
         shutil.copy2(source, destination)
+        clear_file_exists_cache()
         return True
     except Exception as e:
         log_error(f"Error al copiar archivo de {source} a {destination}: {str(e)}")
@@ -52,12 +142,33 @@ def delete_file(file_path):
     """Elimina un archivo con manejo de errores."""
     try:
         Path(file_path).unlink(missing_ok=True)
+        clear_file_exists_cache()
         return True
     except Exception as e:
         log_error(f"Error al eliminar archivo {file_path}: {str(e)}")
         return False
 
+@lru_cache(maxsize=1024)
+def _exists_cached(path_str, bucket):
+    """Comprueba la existencia de una ruta; el bucket agrupa las llamadas por segundo."""
+    return Path(path_str).exists()
+
 def file_exists(file_path):
-    """Comprueba si un archivo existe."""
-    return Path(file_path).exists()
+    """
+    Comprueba si un archivo existe. El resultado se reutiliza durante un
+    segundo para evitar stat repetidos sobre la misma ruta.
+    """
+    return _exists_cached(str(file_path), int(time.monotonic()))
 
+def clear_file_exists_cache():
+    """Invalida la caché de file_exists tras crear o eliminar archivos."""
+    _exists_cached.cache_clear()
+
+def list_file_names(directory_path):
+    """Obtiene el conjunto de nombres de archivo de un directorio con una sola lectura."""
+    try:
+        with os.scandir(directory_path) as entries:
+            return {entry.name for entry in entries}
+    except Exception as e:
+        log_error(f"Error al listar directorio {directory_path}: {str(e)}")
+        return set()
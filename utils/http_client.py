@@ -1,30 +1,234 @@
 # http_client.py
+import os
+import tempfile
+import threading
 import requests
+from concurrent.futures import Future
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from constants import Constants
 from utils.logger import log_error
+from utils.file_utils import clear_file_exists_cache, read_json, write_json
 
-def download_file(url, destination_path, chunk_size=8192):
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx lo necesita para HTTP/2
+except ImportError:  # httpx[http2] es opcional; sin él las descargas usan requests (HTTP/1.1)
+    httpx = None
+
+# Sesión reutilizada por todas las descargas para aprovechar conexiones keep-alive
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Obtiene la sesión HTTP compartida, creándola con pool de conexiones y reintentos."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=Constants.Network.POOL_CONNECTIONS,
+                    pool_maxsize=Constants.Network.POOL_MAXSIZE,
+                    max_retries=Retry(
+                        total=Constants.Network.MAX_RETRIES,
+                        backoff_factor=0.3,
+                        status_forcelist=[502, 503, 504]
+                    )
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+# Cliente HTTP/2 compartido por las descargas de archivos cuando httpx está disponible
+_http2_client = None
+
+def _get_http2_client():
+    """Obtiene el cliente HTTP/2 compartido, que multiplexa las descargas concurrentes sobre una conexión."""
+    global _http2_client
+    if _http2_client is None:
+        with _session_lock:
+            if _http2_client is None:
+                connect_timeout, read_timeout = Constants.Network.REQUEST_TIMEOUT
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=Constants.Network.POOL_CONNECTIONS,
+                        max_keepalive_connections=Constants.Network.POOL_CONNECTIONS
+                    ),
+                    retries=Constants.Network.MAX_RETRIES
+                )
+                _http2_client = httpx.Client(
+                    transport=transport,
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                    follow_redirects=True
+                )
+    return _http2_client
+
+def _open_stream(url, headers=None):
+    """Abre la respuesta en streaming de una URL, por HTTP/2 si httpx está disponible."""
+    if httpx is not None:
+        return _get_http2_client().stream("GET", url, headers=headers)
+    return get_session().get(url, stream=True, headers=headers,
+                             timeout=Constants.Network.REQUEST_TIMEOUT)
+
+def _iter_chunks(response, chunk_size):
+    """Itera el cuerpo de una respuesta abierta con _open_stream."""
+    if httpx is not None:
+        return response.iter_bytes(chunk_size)
+    return response.iter_content(chunk_size=chunk_size)
+
+# Validadores (ETag / Last-Modified) por URL de los archivos descargados; los
+# cambios se acumulan en memoria y se escriben con flush_validators
+_validators = None
+_validators_dirty = False
+_validators_lock = threading.Lock()
+
+def _load_validators():
+    """Carga los validadores del disco la primera vez. Requiere _validators_lock."""
+    global _validators
+    if _validators is None:
+        _validators = read_json(Constants.get_validators_file(), {})
+    return _validators
+
+def _conditional_headers(url):
+    """Construye las cabeceras condicionales para una URL descargada anteriormente."""
+    with _validators_lock:
+        entry = _load_validators().get(url, {})
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def _store_validators(url, etag, last_modified):
+    """Registra los validadores de una descarga, descartando los de las URLs más antiguas."""
+    global _validators_dirty
+    if not etag and not last_modified:
+        return
+    entry = {"etag": etag, "last_modified": last_modified}
+    with _validators_lock:
+        validators = _load_validators()
+        if validators.get(url) == entry:
+            return
+        # Se reinserta al final para que el orden refleje la antigüedad
+        validators.pop(url, None)
+        validators[url] = entry
+        for old_url in list(validators)[:-Constants.Files.VALIDATORS_CACHE_SIZE]:
+            del validators[old_url]
+        _validators_dirty = True
+
+def flush_validators():
     """
-    Descarga un archivo desde una URL a una ruta local.
+    Escribe en disco los validadores pendientes. Se llama al terminar un lote
+    de descargas para no reescribir el archivo en cada una.
+    
+    Returns:
+        bool: True si no había cambios o se guardaron correctamente, False en caso contrario
+    """
+    global _validators_dirty
+    with _validators_lock:
+        if not _validators_dirty:
+            return True
+        if not write_json(Constants.get_validators_file(), _validators):
+            return False
+        _validators_dirty = False
+        return True
+
+# Descargas en curso por ruta de destino, para combinar peticiones concurrentes
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def download_file(url, destination_path, chunk_size=Constants.Network.DOWNLOAD_CHUNK_SIZE,
+                  revalidate=False):
+    """
+    Descarga un archivo desde una URL a una ruta local. Si ya hay una descarga
+    en curso hacia el mismo destino, espera su resultado en lugar de repetirla.
     
     Args:
         url: URL desde donde descargar
         destination_path: Ruta donde guardar el archivo
         chunk_size: Tamaño de los chunks para descarga en streaming
+        revalidate: Si el destino ya existe, se pide con una petición condicional
+            y se conserva la copia local si el servidor responde 304
         
     Returns:
         bool: True si la descarga fue exitosa, False en caso contrario
     """
+    key = Path(destination_path)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+    if not is_owner:
+        return future.result()
+    
+    # La descarga se realiza en el hilo que la pidió primero; quienes la
+    # pidan mientras tanto esperan su resultado
+    result = False
+    try:
+        result = _download_file(url, key, chunk_size, revalidate)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+        future.set_result(result)
+
+def _preallocate(f, size):
+    """Reserva espacio en disco para un archivo cuando se conoce su tamaño."""
+    if size > 0:
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except (AttributeError, OSError):
+            # No disponible en Windows ni en todos los sistemas de archivos
+            pass
+
+def _download_file(url, destination_path, chunk_size, revalidate):
+    """
+    Realiza la descarga de un archivo en streaming. Se escribe primero en un
+    archivo temporal que luego reemplaza al destino, para que nunca se lea
+    un archivo a medio descargar.
+    """
+    temp_path = None
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        
-        with open(destination_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                f.write(chunk)
+        headers = _conditional_headers(url) if revalidate and destination_path.exists() else None
+        # El bloque with devuelve la conexión al pool al terminar el streaming
+        with _open_stream(url, headers) as response:
+            if headers and response.status_code == 304:
+                # Sin cambios en el servidor: la copia local sigue siendo válida
+                return True
+            response.raise_for_status()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            expected_size = int(response.headers.get('Content-Length', 0))
+            
+            # Nombre temporal único: otro escritor del mismo destino no lo pisa
+            with tempfile.NamedTemporaryFile(dir=destination_path.parent,
+                                             prefix=destination_path.name + ".",
+                                             suffix=".tmp", delete=False) as f:
+                temp_path = Path(f.name)
+                _preallocate(f, expected_size)
+                for chunk in _iter_chunks(response, chunk_size):
+                    if chunk:  # filtrar keep-alive chunks
+                        f.write(chunk)
+                # Descarta el espacio reservado que no se llegó a escribir
+                f.truncate()
+        os.replace(temp_path, destination_path)
+        clear_file_exists_cache()
+        _store_validators(url, etag, last_modified)
         return True
     except Exception as e:
         log_error(f"Error al descargar {url} a {destination_path}: {str(e)}")
+        if temp_path is not None:
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
         return False
 
 def download_content(url):
@@ -38,13 +242,47 @@ def download_content(url):
         str o None: Contenido si la descarga fue exitosa, None en caso contrario
     """
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=Constants.Network.REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.text
+        # Bing responde en UTF-8; se evita la detección de codificación de requests
+        return response.content.decode("utf-8")
     except Exception as e:
         log_error(f"Error al descargar contenido de {url}: {str(e)}")
         return None
 
+def download_content_conditional(url, etag=None, last_modified=None):
+    """
+    Descarga contenido desde una URL usando una petición condicional.
+    
+    Args:
+        url: URL desde donde descargar
+        etag: ETag de la última respuesta, enviado como If-None-Match
+        last_modified: Last-Modified de la última respuesta, enviado como If-Modified-Since
+        
+    Returns:
+        tuple: (contenido, etag, last_modified, status). El contenido es None si el
+        servidor respondió 304 (sin cambios) o si hubo un error, en cuyo caso status es None
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        response = get_session().get(url, headers=headers, timeout=Constants.Network.REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            return None, etag, last_modified, 304
+        response.raise_for_status()
+        return (
+            response.content.decode("utf-8"),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            response.status_code
+        )
+    except Exception as e:
+        log_error(f"Error al descargar contenido de {url}: {str(e)}")
+        return None, etag, last_modified, None
+
 def download_binary(url):
     """
     Descarga contenido binario desde una URL.
@@ -56,7 +294,7 @@ def download_binary(url):
         bytes o None: Contenido binario si la descarga fue exitosa, None en caso contrario
     """
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=Constants.Network.REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.content
     except Exception as e:
@@ -1,5 +1,9 @@
 # logger.py
+import atexit
 import logging
+import logging.handlers
+import queue
+import sys
 from pathlib import Path
 from constants import Constants
 
@@ -18,7 +22,8 @@ class AppLogger:
     def __init__(self):
         """Inicializa el logger."""
         self.logger = logging.getLogger('PyBingWallpaper')
-        self.logger.setLevel(logging.INFO)
+        # En el ejecutable empaquetado solo se registran advertencias y errores
+        self.logger.setLevel(logging.WARNING if getattr(sys, "frozen", False) else logging.INFO)
         
         # Asegura que exista el directorio de logs
         log_file = Constants.get_log_file()
@@ -29,7 +34,29 @@ class AppLogger:
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
+        # Agrupa los registros en memoria; un error fuerza la escritura inmediata
+        self._memory_handler = logging.handlers.MemoryHandler(
+            capacity=Constants.Files.LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        
+        # Las llamadas de log solo encolan el registro; un hilo aparte escribe en el archivo
+        log_queue = queue.Queue(-1)
+        self._listener = logging.handlers.QueueListener(
+            log_queue, self._memory_handler, respect_handler_level=True
+        )
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener.start()
+        atexit.register(self.shutdown)
+    
+    def shutdown(self):
+        """Detiene el hilo de escritura y vuelca los registros pendientes al archivo."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            self._memory_handler.flush()
+            self._memory_handler.close()
     
     def info(self, message):
         """Registra un mensaje informativo."""